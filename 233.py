@@ -1,3 +1,8 @@
+from collections import defaultdict
+
+import numpy as np
+
+
 class Observer:
     
     def notify(observable_name):
@@ -16,11 +21,20 @@ class UnknownObserverError(LookupError):
 
 
 
+def _neq(a, b):
+    ## use numpy only for arrays, plain comparison is much cheaper otherwise
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return bool(np.any(a != b))
+    return a != b
+
+
+
 class Observable:
     
     def __init__(self):
-        self._observers = {}
+        self._observers = defaultdict(list)
         self._everything_observers = []
+        self._has_any_observers = False
         
     
     ## observer methods
@@ -32,14 +46,11 @@ class Observable:
         
         ## get specific observer list if observable name is specified
         else:
-            try:
-                observer_list = self._observers[observable_name]
-            except KeyError:
-                observer_list = []
-                self._observers[observable_name] = observer_list
+            observer_list = self._observers[observable_name]
         
         ## add observer
         observer_list.append(observer)
+        self._has_any_observers = True
         
     
     def remove_observer(self, observer, observable_name=None):
@@ -49,10 +60,9 @@ class Observable:
         
         ## get specific observer list if observable name is specified
         else:
-            try:
-                observer_list = self._observers[observable_name]
-            except KeyError:
+            if observable_name not in self._observers:
                 raise UnknownObserverError(observer, observable_name=observable_name)
+            observer_list = self._observers[observable_name]
         
         ## remove observer
         try:
@@ -61,17 +71,18 @@ class Observable:
             raise UnknownObserverError(observer, observable_name=observable_name)
         
         ## remove also list if empty
-        if observable_name is not None and len(observer_listobserver_list) == 0:
+        if observable_name is not None and len(observer_list) == 0:
             del self._observers[observable_name]
+        
+        self._has_any_observers = bool(self._everything_observers) or bool(self._observers)
 
     
     def get_observers(self, observable_name=None, include_everything_observers=True):
-        ## get specifiy observer
+        ## get specifiy observer (without creating an empty entry)
         if observable_name is not None:
-            try:
-                specific_observer = self._observers[observable_name]
-            except KeyError:
-                specific_observer = []
+            specific_observer = self._observers.get(observable_name, [])
+        else:
+            specific_observer = []
         
         ## get all observer
         if include_everything_observers:
@@ -84,12 +95,29 @@ class Observable:
     
     
     def _notify_observers(self, observable_name=None, include_everything_observers=True):
-        for observer in self.get_observers(observable_name=observable_name, include_everything_observers=include_everything_observers):
+        ## snapshot the observer lists instead of building a combined list, so
+        ## observers added or removed by a callback don't disturb this loop
+        if include_everything_observers:
+            everything_observers = tuple(self._everything_observers)
+        else:
+            everything_observers = ()
+        if observable_name is not None:
+            specific_observers = tuple(self._observers.get(observable_name, ()))
+        else:
+            specific_observers = ()
+        if not everything_observers and not specific_observers:
+            return
+        
+        for observer in everything_observers:
+            observer(observable_name)
+        for observer in specific_observers:
             observer(observable_name)
     
     
     def copy_observers_to(self, observable):
         observable._everything_observers.extend(self._everything_observers)
+        if self._everything_observers:
+            observable._has_any_observers = True
 
         for observable_name, observer in self._observers.items():
             observable.add_observer(observer, observable_name=observable_name)
@@ -113,12 +141,19 @@ class Observable:
     
     def _set_observable(self, observable_name, new_value):
         
+        ## fast path if nobody is observing and no sub observers have to be passed on,
+        ## only the notification is skipped, the value is still set only if different
+        if not self._has_any_observers and not isinstance(new_value, Observable):
+            if not self._has_value(observable_name) or _neq(new_value, self._get_value(observable_name)):
+                self._set_value(observable_name, new_value)
+            return
+        
         ## check old value
         if self._has_value(observable_name):
-            old_value = self.new_value(observable_name)
+            old_value = self._get_value(observable_name)
             
             ## set only if different value
-            must_set = np.any(new_value != old_value)
+            must_set = _neq(new_value, old_value)
             if must_set:
                 
                 ## if values are observable_names with observers call associated observers of sub observable_names
@@ -128,11 +163,17 @@ class Observable:
                     
                     ## notify old observer
                     old_value._notify_observers(observable_name=None, include_everything_observers=True)
-                    for observable_name in old_value._observers.keys():
-                        old_has_value = old_value._has_value(observable_name)
-                        new_has_value = new_value._has_value(observable_name)
-                        if old_has_value != new_has_value or (old_has_value and new_has_value and np.any(old_value._get_value(observable_name) != new_value._get_value(observable_name))):
-                            old_value._notify_observers(observable_name=observable_name, include_everything_observers=False)
+                    
+                    ## collect changed sub observable_names first, then notify
+                    changed_names = []
+                    for sub_name in old_value._observers:
+                        old_has_value = old_value._has_value(sub_name)
+                        if old_has_value != new_value._has_value(sub_name):
+                            changed_names.append(sub_name)
+                        elif old_has_value and _neq(old_value._get_value(sub_name), new_value._get_value(sub_name)):
+                            changed_names.append(sub_name)
+                    for sub_name in changed_names:
+                        old_value._notify_observers(observable_name=sub_name, include_everything_observers=False)
         else:
             must_set = True
         
@@ -145,7 +186,8 @@ class Observable:
     
     def _del_observable(self, observable_name):
         self._del_value(observable_name)
-        self._notify_observers(observable_name)
+        if self._has_any_observers:
+            self._notify_observers(observable_name)
 
 
 
@@ -172,7 +214,7 @@ def observable_mutable_mapping_class(MutableMappingClass):
             super().__delitem__(key)
             
         def _has_value(self, key):
-            super().__contains__(key)
+            return super().__contains__(key)
         
         def _get_value(self, key):
             return super().__getitem__(key)
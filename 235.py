@@ -1,26 +1,27 @@
 import psutil
-import os
 from datetime import *
 from files import get_modification_datetime
 
 def is_running(proc_name):
-    output = os.popen("pgrep %s" % proc_name).readlines()
-    if output:
-        return True
-    else:
-        return False
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] == proc_name:
+            return True
+    return False
+
 def is_running_by_ps(command):
-    output = os.popen("ps aux |grep '%s'|grep -v grep" % command).readline()
-    return True if output else False
+    for proc in psutil.process_iter(['cmdline']):
+        if command in ' '.join(proc.info['cmdline'] or ()):
+            return True
+    return False
 
 def get_creation_time(proc_name, proc_owner):
-    pid = os.popen("pgrep -u %s %s" %(proc_owner, proc_name)).readline().strip()
-    proc = psutil.Process(int(pid))
-    return proc.create_time
+    for proc in psutil.process_iter(['name', 'username', 'create_time']):
+        if proc.info['name'] == proc_name and proc.info['username'] == proc_owner:
+            return proc.info['create_time']
+    raise ValueError("no process %r owned by %r is running" % (proc_name, proc_owner))
 
 def service_started(proc_name):
-    process = os.popen('pgrep %s'%proc_name).readline()
-    return True if process else False
+    return is_running(proc_name)
 
 def status_changed_recently(proc_name, reference_file=None, reference_proc=None, proc_owner=None):
     if reference_file:
@@ -41,7 +42,7 @@ def status_changed_recently(proc_name, reference_file=None, reference_proc=None,
             return False
 
 def get_pid(PROCNAME):
-    for proc in psutil.process_iter():
-        if proc.name == PROCNAME:
+    for proc in psutil.process_iter(['name']):
+        if proc.info['name'] == PROCNAME:
             return proc.pid
         
\ No newline at end of file
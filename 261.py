@@ -24,12 +24,14 @@ ALL = (
     SCRIPT_ERROR,
 )
 
+_ALL_SET = frozenset(ALL)
+
 
 def is_valid(status_code):
     """
     Is a status code valid (known)?
     """
-    return status_code in ALL
+    return status_code in _ALL_SET
 
 
 _descriptions = {
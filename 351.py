@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import re
 import uuid
 
 from enum import Enum
@@ -9,20 +10,57 @@ from django.utils.html import mark_safe
 from django.utils.timezone import is_aware
 
 
+_HTML_ESCAPES = str.maketrans({
+    '&': '\\u0026',
+    '<': '\\u003c',
+    '>': '\\u003e',
+    "'": '\\u0027',
+})
+_NEEDS_HTML_ESCAPE = re.compile(r"[&<>']")
+
+
+def _encode_datetime(o):
+    # Same output as strftime('%Y-%m-%dT%H:%M:%S.%fZ'), which drops tzinfo.
+    if o.tzinfo is not None:
+        o = o.replace(tzinfo=None)
+    return o.isoformat(timespec='microseconds') + 'Z'
+
+
+def _encode_time(o):
+    if is_aware(o):
+        raise ValueError("JSON can't represent timezone-aware times.")
+    r = o.isoformat()
+    if o.microsecond:
+        r = r[:12]
+    return r
+
+
+# Exact-type lookup for the common cases; subclasses fall through to the
+# isinstance checks in better_default_encoder.
+_DEFAULT_ENCODERS = {
+    uuid.UUID: lambda o: o.hex,
+    datetime.datetime: _encode_datetime,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: _encode_time,
+    set: list,
+    frozenset: list,
+    decimal.Decimal: str,
+}
+
+
 def better_default_encoder(o):
+    encoder = _DEFAULT_ENCODERS.get(type(o))
+    if encoder is not None:
+        return encoder(o)
+
     if isinstance(o, uuid.UUID):
         return o.hex
     elif isinstance(o, datetime.datetime):
-        return o.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        return _encode_datetime(o)
     elif isinstance(o, datetime.date):
         return o.isoformat()
     elif isinstance(o, datetime.time):
-        if is_aware(o):
-            raise ValueError("JSON can't represent timezone-aware times.")
-        r = o.isoformat()
-        if o.microsecond:
-            r = r[:12]
-        return r
+        return _encode_time(o)
     elif isinstance(o, (set, frozenset)):
         return list(o)
     elif isinstance(o, decimal.Decimal):
@@ -39,11 +77,10 @@ class JSONEncoderForHTML(JSONEncoder):
     def iterencode(self, o, _one_shot=False):
         chunks = super().iterencode(o, _one_shot)
         for chunk in chunks:
-            chunk = chunk.replace('&', '\\u0026')
-            chunk = chunk.replace('<', '\\u003c')
-            chunk = chunk.replace('>', '\\u003e')
-            chunk = chunk.replace("'", '\\u0027')
-            yield chunk
+            if _NEEDS_HTML_ESCAPE.search(chunk) is None:
+                yield chunk
+            else:
+                yield chunk.translate(_HTML_ESCAPES)
 
 
 _default_encoder = JSONEncoder(
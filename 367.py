@@ -8,6 +8,7 @@ class Client(object):
 
     def __init__(self, url):
         self.url = url
+        self._session = requests.Session()
 
     def __getattr__(self, name):
         setattr(self, name, Api(self, name))
@@ -26,7 +27,14 @@ class AutoApiHttp(object):
     def headers(self):
         return self.parent.headers()
 
-    def _http(self, fun, url=None, **kargs):
+    def _root_session(self):
+        node = self.parent
+        while not isinstance(node, Client):
+            node = node.parent
+        return node._session
+
+    def _http(self, method, url=None, **kargs):
+        fun = getattr(self._root_session(), method)
         return fun(url or self.url(), headers=self.headers(), **kargs)
 
 
@@ -37,14 +45,14 @@ class Api(AutoApiHttp):
         self.id = api_name
         self.logged = False
         self._headers = {}
-        self._collections = []
+        self._cache = {}
 
     def headers(self):
         return self._headers
 
     def login(self, email, password):
         response = self._http(
-            requests.post,
+            'post',
             url="%s/login" % self.parent.url,
             json={'api': self.id, 'email': email, 'password': password}
         )
@@ -57,20 +65,20 @@ class Api(AutoApiHttp):
 
     def logout(self):
         self._http(
-            requests.post,
+            'post',
             url="%s/logout" % self.parent.url,
             json={'api': self.id}
         )
         self.logged = False
         self._headers = {}
-        for key in self._collections:
-            delattr(self, key)
+        self._cache.clear()
 
     def __getattr__(self, name):
         if self.logged:
-            setattr(self, name, Collection(self, name))
-            self._collections.append(name)
-            return self[name]
+            collection = self._cache.get(name)
+            if collection is None:
+                collection = self._cache[name] = Collection(self, name)
+            return collection
         raise AuthException("Api must be logged, use login method")
 
     def __getitem__(self, name):
@@ -84,12 +92,12 @@ class Collection(AutoApiHttp):
         self.id = collection_name
 
     def get(self, params=None):
-        response = self._http(requests.get, params=params)
+        response = self._http('get', params=params)
         if response.status_code == 200:
             return response.json()
 
     def post(self, json=None):
-        response = self._http(requests.post, json=json)
+        response = self._http('post', json=json)
         if response.status_code == 201:
             return response.json()
 
@@ -105,36 +113,41 @@ class Resource(AutoApiHttp):
     def __init__(self, parent, resource_id):
         self.parent = parent
         self.id = resource_id
-        response = self._http(requests.get)
+        self._items = None
+
+    def _load(self):
+        response = self._http('get')
         if response.status_code != 200:
             raise ResourceException("Not found resource")
         json = response.json()
-        self._items = json.keys()
-        for key in json:
-            setattr(self, key, json[key])
+        self._items = {key: json[key] for key in json if key != 'id'}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._items is None:
+            self._load()
+        try:
+            return self._items[name]
+        except KeyError:
+            raise AttributeError(name)
 
     def delete(self):
-        response = self._http(requests.delete)
+        response = self._http('delete')
         return response.status_code == 204
 
     def put(self, json=None):
-        response = self._http(requests.put, json=json)
+        response = self._http('put', json=json)
         if response.status_code == 204:
-            for key in self._items:
-                if key != 'id':
-                    delattr(self, key)
-            for key in json:
-                if key != 'id':
-                    setattr(self, key, json[key])
-            self._items = json.keys()
+            self._items = {key: json[key] for key in json if key != 'id'}
         return response.status_code == 204
 
     def patch(self, json=None):
-        response = self._http(requests.patch, json=json)
-        if response.status_code == 204:
+        response = self._http('patch', json=json)
+        if response.status_code == 204 and self._items is not None:
             for key in json:
                 if key != 'id':
-                    setattr(self, key, json[key])
+                    self._items[key] = json[key]
         return response.status_code == 204
 
     def __getitem__(self, resource_id):
@@ -4,39 +4,141 @@ A new Python wrapper for interacting with the Open311 API.
 
 import os
 import re
+import ssl
+import weakref
 from collections import defaultdict
 from datetime import date
 
+try:
+    from urllib.parse import urlsplit
+except ImportError:
+    # Python 2
+    from urlparse import urlsplit
+
 
 import requests
 from relaxml import xml
-import simplejson as json
 
 try:
-    # Python 2
-    from future_builtins import filter
+    # Faster parser for API responses when available.
+    import orjson as json
+except ImportError:
+    import simplejson as json
+
+try:
+    from functools import lru_cache
 except ImportError:
-    # Python 3
-    pass
+    # Python 2
+    def lru_cache(maxsize=128):
+        """Small stand-in for lru_cache on one argument, cleared when full."""
+        def decorator(function):
+            cache = {}
+
+            def wrapper(arg):
+                try:
+                    return cache[arg]
+                except KeyError:
+                    if len(cache) >= maxsize:
+                        cache.clear()
+                    result = cache[arg] = function(arg)
+                    return result
+            return wrapper
+        return decorator
+
+
+_DATE_SEPARATOR = re.compile(r'[-/]')
+
+
+@lru_cache(maxsize=256)
+def _format_date_string(time):
+    """Format a month-day-year date string, caching repeated values."""
+    month, day, year = [int(t) for t in _DATE_SEPARATOR.split(time)]
+    if year < 100:
+        # Quick hack for dates < 2000.
+        year += 2000
+    return date(year, month, day).strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
 class SSLAdapter(requests.adapters.HTTPAdapter):
     """An HTTPS Transport Adapter that uses an arbitrary SSL version."""
     def __init__(self, ssl_version=None, **kwargs):
         self.ssl_version = ssl_version
+        # One SSL context per certificate requirement, built on first use and
+        # shared by the pools that need it. A context is never switched
+        # between verifying and non verifying.
+        self._ssl_contexts = {}
+        kwargs.setdefault('pool_connections', 10)
+        kwargs.setdefault('pool_maxsize', 100)
+        kwargs.setdefault('pool_block', False)
         super(SSLAdapter, self).__init__(**kwargs)
 
-    def init_poolmanager(self, connections, maxsize, block):
+    @staticmethod
+    def _create_ssl_context(ssl_version, cert_reqs):
+        """Create an SSL context pinned to the given version."""
+        if ssl_version is None:
+            context = ssl.create_default_context()
+        else:
+            context = ssl.SSLContext(ssl_version)
+            context.load_default_certs()
+        if cert_reqs == 'CERT_NONE':
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        else:
+            context.verify_mode = ssl.CERT_REQUIRED
+            context.check_hostname = True
+        return context
+
+    def _ssl_context(self, cert_reqs):
+        """Return the SSL context for ``cert_reqs``, creating it if needed."""
+        context = self._ssl_contexts.get(cert_reqs)
+        if context is None:
+            context = self._create_ssl_context(self.ssl_version, cert_reqs)
+            self._ssl_contexts[cert_reqs] = context
+        return context
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
         self.poolmanager = requests.packages.urllib3.poolmanager.PoolManager(
             num_pools=connections,
             maxsize=maxsize,
             block=block,
-            ssl_version=self.ssl_version)
+            ssl_context=self._ssl_context('CERT_REQUIRED'),
+            **pool_kwargs)
+
+    def cert_verify(self, conn, url, verify, cert):
+        super(SSLAdapter, self).cert_verify(conn, url, verify, cert)
+        if url.lower().startswith('https'):
+            # New connections of this pool use the context matching the
+            # certificate requirement requests just set on it.
+            conn.conn_kw['ssl_context'] = self._ssl_context(conn.cert_reqs)
+
+
+_UNSET = object()
+
+# Sessions shared between Three instances talking to the same host with the
+# same SSL settings. Cookies, auth and headers set on a session are visible to
+# every instance sharing it.
+_SESSIONS = weakref.WeakValueDictionary()
+
+
+def _shared_session(endpoint, ssl_version=_UNSET):
+    """Return a session for the endpoint host, reusing a live one if any."""
+    parts = urlsplit(endpoint)
+    key = (ssl_version, parts.scheme, parts.netloc)
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        if ssl_version is not _UNSET:
+            session.mount('https://', SSLAdapter(ssl_version))
+        _SESSIONS[key] = session
+    return session
 
 
 class Three(object):
     """The main class for interacting with the Open311 API."""
 
+    _api_key_cache = _UNSET
+
     def __init__(self, endpoint=None, **kwargs):
         keywords = defaultdict(str)
         keywords.update(kwargs)
@@ -55,13 +157,12 @@ class Three(object):
     def _global_api_key(self):
         """
         If a global Open311 API key is available as an environment variable,
-        then it will be used when querying.
+        then it will be used when querying. The lookup is done once and
+        cached on the class.
         """
-        if 'OPEN311_API_KEY' in os.environ:
-            api_key = os.environ['OPEN311_API_KEY']
-        else:
-            api_key = ''
-        return api_key
+        if Three._api_key_cache is _UNSET:
+            Three._api_key_cache = os.environ.get('OPEN311_API_KEY', '')
+        return Three._api_key_cache
 
     def configure(self, endpoint=None, **kwargs):
         """Configure a previously initialized instance of the class."""
@@ -76,15 +177,16 @@ class Three(object):
         self.api_key = keywords['api_key'] or self._global_api_key()
         self.endpoint = keywords['endpoint']
         self.format = keywords['format'] or 'json'
+        self._path_tail = '.' + self.format
         self.jurisdiction = keywords['jurisdiction']
         self.proxy = keywords['proxy']
         self.discovery_url = keywords['discovery'] or None
 
         # Use a custom requests session and set the correct SSL version if
-        # specified.
-        self.session = requests.Session()
-        if 'ssl_version' in keywords:
-            self.session.mount('https://', SSLAdapter(keywords['ssl_version']))
+        # specified. Sessions are shared per host so reconfiguring keeps the
+        # pool.
+        self.session = _shared_session(self.endpoint,
+                                       keywords.get('ssl_version', _UNSET))
 
     def _configure_endpoint(self, endpoint):
         """Configure the endpoint with a schema and end slash."""
@@ -100,9 +202,7 @@ class Three(object):
 
     def _create_path(self, *args):
         """Create URL path for endpoint and args."""
-        args = filter(None, args)
-        path = self.endpoint + '/'.join(args) + '.%s' % (self.format)
-        return path
+        return self.endpoint + '/'.join(a for a in args if a) + self._path_tail
 
     def get(self, *args, **kwargs):
         """Perform a get request."""
@@ -148,11 +248,7 @@ class Three(object):
     def _split_date(self, time):
         """Split apart a date string."""
         if isinstance(time, str):
-            month, day, year = [int(t) for t in re.split(r'-|/', time)]
-            if year < 100:
-                # Quick hack for dates < 2000.
-                year += 2000
-            time = date(year, month, day)
+            return _format_date_string(time)
         return time.strftime('%Y-%m-%dT%H:%M:%SZ')
 
     def convert(self, content, conversion):
@@ -1,43 +1,254 @@
-from math import sqrt
+from collections import Counter, defaultdict
+from functools import partial
+from itertools import combinations
 import numpy as np
-import pandas as pd
-from scipy.spatial.distance import pdist, squareform, euclidean
+from scipy.spatial.distance import pdist, squareform
 import networkx as nx
 from sklearn import cluster
+from joblib import Parallel, delayed
 from lens import apply_lens
-import scipy
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
-def davies_bouldin(dist_mu, sigma):
-    DB = 0
-    K = len(sigma)
+try:
+    from cuml.cluster import KMeans as cuKMeans
+except ImportError:
+    cuKMeans = None
+
+# below this many points per patch the GPU transfer outweighs the fits
+_GPU_MIN_POINTS = 10000
+
+# patches are small and low-dimensional, so a few k-means++ restarts with
+# elkan's algorithm are plenty
+_KMEANS_PARAMS = dict(n_init=3, init='k-means++', algorithm='elkan', tol=1e-3, copy_x=False)
+
+# below this many patches the worker start-up costs more than it saves
+_PARALLEL_MIN_PATCHES = 32
+
+# up to this many dimensions the numba Lloyd kernel beats sklearn's setup cost
+_SMALL_D = 4
+
+
+def _davies_bouldin_loop(dist_mu, sigma):
+    K = sigma.shape[0]
+    D = np.zeros(K)
+    pair = 0
     for i in range(K):
-        D_i = 0
-        for j in range(K):
-            if j == i:
-                continue
-            R_ij = (sigma[i] + sigma[j]) / dist_mu[i, j]
-            if R_ij > D_i:
-                D_i = R_ij
-        DB += D_i
-    return DB / K
+        for j in range(i + 1, K):
+            R_ij = (sigma[i] + sigma[j]) / dist_mu[pair]
+            if R_ij > D[i]:
+                D[i] = R_ij
+            if R_ij > D[j]:
+                D[j] = R_ij
+            pair += 1
+    return D.sum() / K
+
+
+if njit is not None:
+    _davies_bouldin_jit = njit(cache=True)(_davies_bouldin_loop)
+else:
+    _davies_bouldin_jit = None
+
+
+def davies_bouldin(dist_mu, sigma):
+    """
+    dist_mu: condensed pairwise distances of the cluster centers, as returned
+    by pdist (a square distance matrix is also accepted)
+    """
+    sigma = np.asarray(sigma, dtype=np.float64)
+    dist_mu = np.asarray(dist_mu, dtype=np.float64)
+    if dist_mu.ndim == 2:
+        dist_mu = squareform(dist_mu, checks=False)
+    if _davies_bouldin_jit is not None:
+        return _davies_bouldin_jit(np.ascontiguousarray(dist_mu), sigma)
+    i, j = np.triu_indices(len(sigma), 1)
+    R = (sigma[i] + sigma[j]) / dist_mu
+    D = np.zeros(len(sigma))
+    np.maximum.at(D, i, R)
+    np.maximum.at(D, j, R)
+    return float(D.mean())
+
+
+def _lloyd_assign(X, centers, labels):
+    n, d = X.shape
+    K = centers.shape[0]
+    changed = False
+    inertia = 0.0
+    for i in range(n):
+        best = 0
+        best_dist = np.inf
+        for kk in range(K):
+            dist = 0.0
+            for dd in range(d):
+                t = X[i, dd] - centers[kk, dd]
+                dist += t * t
+            if dist < best_dist:
+                best_dist = dist
+                best = kk
+        if labels[i] != best:
+            labels[i] = best
+            changed = True
+        inertia += best_dist
+    return changed, inertia
+
+
+def _lloyd_small_d_loop(X, init, n_iter):
+    n, d = X.shape
+    K = init.shape[0]
+    centers = init.copy()
+    labels = np.full(n, -1, np.int64)
+    sums = np.empty((K, d))
+    counts = np.empty(K)
+    changed, inertia = _lloyd_assign(X, centers, labels)
+    for it in range(n_iter):
+        if not changed:
+            break
+        sums[:] = 0.0
+        counts[:] = 0.0
+        for i in range(n):
+            counts[labels[i]] += 1
+            for dd in range(d):
+                sums[labels[i], dd] += X[i, dd]
+        for kk in range(K):
+            if counts[kk] == 0:
+                # relocate an empty cluster to the point farthest from its
+                # center, taken from a cluster that keeps at least one point
+                far = -1
+                far_dist = -1.0
+                for i in range(n):
+                    if counts[labels[i]] > 1:
+                        dist = 0.0
+                        for dd in range(d):
+                            t = X[i, dd] - centers[labels[i], dd]
+                            dist += t * t
+                        if dist > far_dist:
+                            far_dist = dist
+                            far = i
+                if far >= 0:
+                    counts[labels[far]] -= 1
+                    for dd in range(d):
+                        sums[labels[far], dd] -= X[far, dd]
+                        sums[kk, dd] = X[far, dd]
+                    counts[kk] = 1
+                    labels[far] = kk
+        for kk in range(K):
+            if counts[kk] > 0:
+                for dd in range(d):
+                    centers[kk, dd] = sums[kk, dd] / counts[kk]
+        changed, inertia = _lloyd_assign(X, centers, labels)
+    return labels, centers, inertia
+
+
+if njit is not None:
+    _lloyd_assign = njit(cache=True)(_lloyd_assign)
+    _lloyd_small_d = njit(cache=True)(_lloyd_small_d_loop)
+else:
+    _lloyd_small_d = None
+
+
+def _kmeans_plusplus(X, k):
+    centers = np.empty((k, X.shape[1]))
+    centers[0] = X[np.random.randint(len(X))]
+    d2 = ((X - centers[0]) ** 2).sum(axis=1)
+    for c in range(1, k):
+        total = d2.sum()
+        if total > 0:
+            idx = np.random.choice(len(X), p=d2 / total)
+        else:
+            idx = np.random.randint(len(X))
+        centers[c] = X[idx]
+        d2 = np.minimum(d2, ((X - centers[c]) ** 2).sum(axis=1))
+    return centers
+
+
+class _SmallKMeans(object):
+    """
+    KMeans replacement for low-dimensional patches, running Lloyd's algorithm compiled with numba
+    (same fit interface as the parts of sklearn's KMeans used here)
+    """
+
+    def __init__(self, n_clusters=8, init='k-means++', n_init=3, max_iter=50):
+        self.n_clusters = n_clusters
+        self.init = init
+        self.n_init = n_init
+        self.max_iter = max_iter
+
+    def fit(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        if isinstance(self.init, str):
+            seeds = [_kmeans_plusplus(X, self.n_clusters) for _ in range(self.n_init)]
+        else:
+            seeds = [np.array(self.init, dtype=np.float64)]
+        best = None
+        for seed in seeds:
+            result = _lloyd_small_d(X, seed, self.max_iter)
+            if best is None or result[2] < best[2]:
+                best = result
+        if np.bincount(best[0], minlength=self.n_clusters).min() == 0:
+            # Lloyd ran out of iterations with a cluster still empty
+            g = cluster.KMeans(n_clusters=self.n_clusters, **_KMEANS_PARAMS).fit(X)
+            best = g.labels_, g.cluster_centers_, g.inertia_
+        self.labels_, self.cluster_centers_, self.inertia_ = best
+        return self
+
+    def fit_predict(self, X):
+        return self.fit(X).labels_
+
+
+def _kmeans_method(X, gpu=False):
+    """
+    KMeans class to fit X with; cuML is only considered when gpu is set, i.e. for the many fits of the gap statistic
+    """
+    if gpu and cuKMeans is not None and len(X) >= _GPU_MIN_POINTS:
+        return cuKMeans
+    if _lloyd_small_d is not None and X.shape[1] <= _SMALL_D:
+        return _SmallKMeans
+    return partial(cluster.KMeans, **_KMEANS_PARAMS)
+
+
+def _assign_patches(lens_data, resolution, lower_bound_x, upper_bound_x, lower_bound_y, upper_bound_y):
+    cols = lens_data.columns
+    x = lens_data[cols[0]].values
+    y = lens_data[cols[1]].values
+    index = lens_data.index.values
+
+    # x band membership is computed once for all points; inside a band the
+    # points are sorted by y so every patch is a range query on that order
+    in_x = (x[:, None] > lower_bound_x[:resolution]) & (x[:, None] < upper_bound_x[:resolution])
+
+    keys_x = [(round(lower_bound_x[i], 2), round(upper_bound_x[i], 2)) for i in range(resolution)]
+    keys_y = [(round(lower_bound_y[j], 2), round(upper_bound_y[j], 2)) for j in range(resolution)]
+
+    patch_dict = {}
+    for i in range(resolution):
+        rows = np.flatnonzero(in_x[:, i])
+        rows = rows[np.argsort(y[rows], kind='mergesort')]
+        ys = y[rows]
+        starts = np.searchsorted(ys, lower_bound_y[:resolution], side='right')
+        stops = np.searchsorted(ys, upper_bound_y[:resolution], side='left')
+        for j in range(resolution):
+            patch_dict[(keys_x[i], keys_y[j])] = index[np.sort(rows[starts[j]:stops[j]])].tolist()
+    return patch_dict
 
 
 def covering_patches(lens_data, resolution=10, gain=0.5, equalize=True):
     cols = lens_data.columns
     xmin, xmax = lens_data[cols[0]].min(), lens_data[cols[0]].max()
     ymin, ymax = lens_data[cols[1]].min(), lens_data[cols[1]].max()
-    patch_dict = {}
 
     if equalize:
         perc_step = 100.0 / resolution
-        fence_posts_x = [np.percentile(lens_data[cols[0]], post) for post in np.arange(perc_step, 100, perc_step)]
-        fence_posts_y = [np.percentile(lens_data[cols[1]], post) for post in np.arange(perc_step, 100, perc_step)]
+        posts = np.arange(perc_step, 100, perc_step)
+        fence_posts_x = np.percentile(lens_data[cols[0]].values, posts)
+        fence_posts_y = np.percentile(lens_data[cols[1]].values, posts)
 
-        lower_bound_x = np.array([xmin] + fence_posts_x)
-        upper_bound_x = np.array(fence_posts_x + [xmax])
-        lower_bound_y = np.array([ymin] + fence_posts_y)
-        upper_bound_y = np.array(fence_posts_y + [ymax])
+        lower_bound_x = np.concatenate(([xmin], fence_posts_x))
+        upper_bound_x = np.concatenate((fence_posts_x, [xmax]))
+        lower_bound_y = np.concatenate(([ymin], fence_posts_y))
+        upper_bound_y = np.concatenate((fence_posts_y, [ymax]))
 
         widths_x = upper_bound_x - lower_bound_x
         spill_over_x = gain * widths_x
@@ -48,16 +259,7 @@ def covering_patches(lens_data, resolution=10, gain=0.5, equalize=True):
         lower_bound_y -= spill_over_y
         upper_bound_y += spill_over_y
 
-        for i in range(resolution):
-            for j in range(resolution):
-                patch = list(lens_data[(lens_data[cols[0]] > lower_bound_x[i]) &
-                                       (lens_data[cols[0]] < upper_bound_x[i]) &
-                                       (lens_data[cols[1]] > lower_bound_y[j]) &
-                                       (lens_data[cols[1]] < upper_bound_y[j])].index)
-                key = ((round(lower_bound_x[i], 2), round(upper_bound_x[i], 2)),
-                       (round(lower_bound_y[j], 2), round(upper_bound_y[j], 2)))
-                patch_dict[key] = patch
-        return patch_dict
+        return _assign_patches(lens_data, resolution, lower_bound_x, upper_bound_x, lower_bound_y, upper_bound_y)
 
     else:
         width_x = (xmax - xmin) / resolution
@@ -69,16 +271,25 @@ def covering_patches(lens_data, resolution=10, gain=0.5, equalize=True):
         upper_bound_x = np.arange(xmin, xmax, width_x) + width_x + spill_over_x
         lower_bound_y = np.arange(ymin, ymax, width_y) - spill_over_y
         upper_bound_y = np.arange(ymin, ymax, width_y) + width_y + spill_over_y
-        for i in range(resolution):
-            for j in range(resolution):
-                patch = list(lens_data[(lens_data[cols[0]] > lower_bound_x[i]) &
-                                       (lens_data[cols[0]] < upper_bound_x[i]) &
-                                       (lens_data[cols[1]] > lower_bound_y[j]) &
-                                       (lens_data[cols[1]] < upper_bound_y[j])].index)
-                key = ((round(lower_bound_x[i], 2), round(upper_bound_x[i], 2)),
-                       (round(lower_bound_y[j], 2), round(upper_bound_y[j], 2)))
-                patch_dict[key] = patch
-        return patch_dict
+        return _assign_patches(lens_data, resolution, lower_bound_x, upper_bound_x, lower_bound_y, upper_bound_y)
+
+
+def _fit_dispersion(method, X, k, prev=None):
+    """
+    cluster X into k clusters, warm-started from prev (the (centers, distances) result for k - 1)
+    output: (centers, distance of every point to its center)
+    """
+    if k == 1:
+        centers = X.mean(axis=0, keepdims=True)
+        return centers, np.linalg.norm(X - centers, axis=1)
+    if prev is not None and len(prev[0]) == k - 1:
+        centers, dists = prev
+        init = np.vstack((centers, X[np.argmax(dists)]))
+        g = method(n_clusters=k, init=init, n_init=1).fit(X)
+    else:
+        g = method(n_clusters=k).fit(X)
+    centers = g.cluster_centers_
+    return centers, np.linalg.norm(X - centers[g.labels_], axis=1)
 
 
 def gap(data, refs=None, nrefs=20, ks=range(1,11), method=None):
@@ -86,29 +297,54 @@ def gap(data, refs=None, nrefs=20, ks=range(1,11), method=None):
     if refs is None:
         tops = data.max(axis=0)
         bots = data.min(axis=0)
-        dists = scipy.matrix(scipy.diag(tops-bots))
-
-        rands = scipy.random.random_sample(size=(shape[0], shape[1], nrefs))
-        for i in range(nrefs):
-            rands[:, :, i] = rands[:, :, i]*dists+bots
+        rands = bots + (tops - bots) * np.random.random_sample(size=(nrefs, shape[0], shape[1]))
     else:
-        rands = refs
-    gaps = scipy.zeros((len(ks),))
+        rands = np.ascontiguousarray(refs.transpose(2, 0, 1))
+    gaps = np.zeros((len(ks),))
+    fit = None
+    ref_fits = [None] * rands.shape[0]
     for (i, k) in enumerate(ks):
-        g1 = method(n_clusters=k).fit(data)
-        (kmc, kml) = (g1.cluster_centers_, g1.labels_)
-        disp = sum([euclidean(data[m, :], kmc[kml[m], :]) for m in range(shape[0])])
-
-        refdisps = scipy.zeros((rands.shape[2],))
-        for j in range(rands.shape[2]):
-            g2 = method(n_clusters=k).fit(rands[:, :, j])
-            (kmc, kml) = (g2.cluster_centers_, g2.labels_)
-            refdisps[j] = sum([euclidean(rands[m, :, j], kmc[kml[m],:]) for m in range(shape[0])])
-        gaps[i] = scipy.log(scipy.mean(refdisps))-scipy.log(disp)
+        fit = _fit_dispersion(method, data, k, fit)
+        disp = fit[1].sum()
+
+        refdisps = np.zeros((rands.shape[0],))
+        for j in range(rands.shape[0]):
+            ref_fits[j] = _fit_dispersion(method, rands[j], k, ref_fits[j])
+            refdisps[j] = ref_fits[j][1].sum()
+        gaps[i] = np.log(np.mean(refdisps))-np.log(disp)
     return gaps
 
 
-def optimal_clustering(df, patch, method='kmeans', statistic='gap', max_K=5):
+def _cluster_spread(X, labels, k):
+    sigma = np.zeros(k)
+    for i in range(k):
+        points = X[labels == i]
+        if len(points) > 1:
+            sigma[i] = np.sqrt(points.var(axis=0, ddof=1).sum())
+    return sigma
+
+
+def _split_patch(patch, labels, k):
+    patch = np.asarray(patch)
+    return [patch[labels == i].tolist() for i in range(k)]
+
+
+def _patch_positions(index, patch):
+    """
+    row positions in index of the labels in patch; every label must be present exactly once
+    """
+    positions = index.get_indexer(patch)
+    missing = positions < 0
+    if missing.any():
+        raise KeyError('patch labels not in the data index: {}'.format(np.asarray(patch)[missing][:10].tolist()))
+    return positions
+
+
+def optimal_clustering(X_all, patch, method='kmeans', statistic='gap', max_K=5):
+    """
+    X_all: array with one row per data point
+    patch: row positions in X_all to cluster; clusters are returned as lists of these positions
+    """
     if len(patch) == 1:
         return [patch]
 
@@ -118,74 +354,75 @@ def optimal_clustering(df, patch, method='kmeans', statistic='gap', max_K=5):
                 K_max = 2
             else:
                 K_max = min(len(patch) / 2, max_K)
-            clustering = {}
+            labels_by_k = {}
             db_index = []
-            X = df.ix[patch, :]
+            X = X_all[patch]
             for k in range(2, K_max + 1):
-                kmeans = cluster.KMeans(n_clusters=k).fit(X)
-                clustering[k] = pd.DataFrame(kmeans.predict(X), index=patch)
-                dist_mu = squareform(pdist(kmeans.cluster_centers_))
-                sigma = []
-                for i in range(k):
-                    points_in_cluster = clustering[k][clustering[k][0] == i].index
-                    sigma.append(sqrt(X.ix[points_in_cluster, :].var(axis=0).sum()))
-                db_index.append(davies_bouldin(dist_mu, np.array(sigma)))
+                kmeans = _kmeans_method(X)(n_clusters=k).fit(X)
+                labels_by_k[k] = kmeans.labels_
+                dist_mu = pdist(kmeans.cluster_centers_)
+                db_index.append(davies_bouldin(dist_mu, _cluster_spread(X, kmeans.labels_, k)))
             db_index = np.array(db_index)
             k_optimal = np.argmin(db_index) + 2
-            return [list(clustering[k_optimal][clustering[k_optimal][0] == i].index) for i in range(k_optimal)]
+            return _split_patch(patch, labels_by_k[k_optimal], k_optimal)
 
         elif method == 'agglomerative':
             if len(patch) <= 5:
                 K_max = 2
             else:
                 K_max = min(len(patch) / 2, max_K)
-            clustering = {}
+            labels_by_k = {}
             db_index = []
-            X = df.ix[patch, :]
+            X = X_all[patch]
             for k in range(2, K_max + 1):
                 agglomerative = cluster.AgglomerativeClustering(n_clusters=k, linkage='average').fit(X)
-                clustering[k] = pd.DataFrame(agglomerative.fit_predict(X), index=patch)
-                tmp = [list(clustering[k][clustering[k][0] == i].index) for i in range(k)]
-                centers = np.array([np.mean(X.ix[c, :], axis=0) for c in tmp])
-                dist_mu = squareform(pdist(centers))
-                sigma = []
-                for i in range(k):
-                    points_in_cluster = clustering[k][clustering[k][0] == i].index
-                    sigma.append(sqrt(X.ix[points_in_cluster, :].var(axis=0).sum()))
-                db_index.append(davies_bouldin(dist_mu, np.array(sigma)))
+                labels = agglomerative.labels_
+                labels_by_k[k] = labels
+                centers = np.array([X[labels == i].mean(axis=0) for i in range(k)])
+                dist_mu = pdist(centers)
+                db_index.append(davies_bouldin(dist_mu, _cluster_spread(X, labels, k)))
             db_index = np.array(db_index)
             k_optimal = np.argmin(db_index) + 2
-            return [list(clustering[k_optimal][clustering[k_optimal][0] == i].index) for i in range(k_optimal)]
+            return _split_patch(patch, labels_by_k[k_optimal], k_optimal)
 
     elif statistic == 'gap':
-        X = np.array(df.ix[patch, :])
+        X = X_all[patch]
         if method == 'kmeans':
-            f = cluster.KMeans
+            f = _kmeans_method(X, gpu=True)
         gaps = gap(X, ks=range(1, min(max_K, len(patch))), method=f)
         k_optimal = list(gaps).index(max(gaps))+1
-        clustering = pd.DataFrame(f(n_clusters=k_optimal).fit_predict(X), index=patch)
-        return [list(clustering[clustering[0] == i].index) for i in range(k_optimal)]
+        return _split_patch(patch, f(n_clusters=k_optimal).fit_predict(X), k_optimal)
 
     else:
         raise 'error: only db and gat statistics are supported'
 
 
 def mapper_graph(df, lens_data=None, lens='pca', resolution=10, gain=0.5, equalize=True, clust='kmeans', stat='db',
-                 max_K=5):
+                 max_K=5, n_jobs=1):
     """
     input: N x n_dim image of of raw data under lens function, as a dataframe
     output: (undirected graph, list of node contents, dictionary of patches)
+    n_jobs: number of worker processes used to cluster the patches (-1 for all cores); only used when there are
+    at least _PARALLEL_MIN_PATCHES patches
     """
+    if not df.index.is_unique:
+        raise ValueError('mapper_graph needs a dataframe with a unique index')
     if lens_data is None:
         lens_data = apply_lens(df, lens=lens)
 
-    patch_clusterings = {}
-    counter = 0
     patches = covering_patches(lens_data, resolution=resolution, gain=gain, equalize=equalize)
-    for key, patch in patches.items():
-        if len(patch) > 0:
-            patch_clusterings[key] = optimal_clustering(df, patch, method=clust, statistic=stat, max_K=max_K)
-            counter += 1
+    X_all = np.asarray(df.values, dtype=np.float32)
+    keys = [key for key, patch in patches.items() if len(patch) > 0]
+    positions = [_patch_positions(df.index, patches[key]) for key in keys]
+    cluster_patch = partial(optimal_clustering, method=clust, statistic=stat, max_K=max_K)
+    if n_jobs != 1 and len(keys) >= _PARALLEL_MIN_PATCHES:
+        # X_all is memmapped once for all workers instead of pickled per patch
+        results = Parallel(n_jobs=n_jobs, backend='loky', max_nbytes='1M', mmap_mode='r')(
+            delayed(cluster_patch)(X_all, patch) for patch in positions)
+    else:
+        results = [cluster_patch(X_all, patch) for patch in positions]
+    patch_clusterings = dict((key, [df.index[c].tolist() for c in clusters]) for key, clusters in zip(keys, results))
+    counter = len(keys)
     print 'total of {} patches required clustering'.format(counter)
 
     all_clusters = []
@@ -194,23 +431,23 @@ def mapper_graph(df, lens_data=None, lens='pca', resolution=10, gain=0.5, equali
     num_nodes = len(all_clusters)
     print 'this implies {} nodes in the mapper graph'.format(num_nodes)
 
-    A = np.zeros((num_nodes, num_nodes))
-    for i in range(num_nodes):
-        for j in range(i):
-            overlap = set(all_clusters[i]).intersection(set(all_clusters[j]))
-            if len(overlap) > 0:
-                A[i, j] = 1
-                A[j, i] = 1
+    point_to_clusters = defaultdict(set)
+    for cid, members in enumerate(all_clusters):
+        for p in members:
+            point_to_clusters[p].add(cid)
+    edges = set()
+    for cids in point_to_clusters.values():
+        edges.update(combinations(sorted(cids), 2))
 
-    G = nx.from_numpy_matrix(A)
-    total = []
+    G = nx.Graph()
+    G.add_nodes_from(range(num_nodes))
+    G.add_edges_from(edges, weight=1.0)
+    point_counter = Counter(p for m in all_clusters for p in m)
     all_clusters_new = []
     mapping = {}
     cont = 0
-    for m in all_clusters:
-        total += m
     for n, m in enumerate(all_clusters):
-        if len(m) == 1 and total.count(m) > 1:
+        if len(m) == 1 and point_counter[m[0]] > 1:
             G.remove_node(n)
         else:
             all_clusters_new.append(m)
@@ -33,10 +33,17 @@ import struct
 import logging
 from operator import getitem as _getitem
 from uuid import UUID
-from abc import ABCMeta, abstractmethod
-from math import ceil as _ceil
+from codecs import utf_16_le_decode as _utf16le
+from functools import lru_cache as _lru_cache
+from array import array as _array
 import sys as _sys
 
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = _njit = None
+
 from libmft.util.functions import convert_filetime, get_file_reference
 from libmft.flagsandtypes import AttrTypes, AttrFlags, NameType, FileInfoFlags, \
     IndexEntryFlags, VolumeFlags, ReparseType, ReparseFlags, CollationRule, \
@@ -52,6 +59,95 @@ _MOD_LOGGER = logging.getLogger(__name__)
 '''logging.Logger: Module level logger for all the logging needs of the module'''
 _ATTR_BASIC = struct.Struct("<2IB")
 '''struct.Struct: Struct to get basic information from the attribute header'''
+_ATTR_BASIC_UNPACK_FROM = _ATTR_BASIC.unpack_from
+_convert_filetime = _lru_cache(maxsize=16384)(convert_filetime)
+'''function: ``convert_filetime`` memoized, as the same timestamps repeat a lot in a MFT'''
+_ATTR_END_MARKER = 0xFFFFFFFF
+'''int: Attribute type id that marks the end of the attributes in an entry'''
+_EA_SCAN_MIN_SIZE = 1024
+'''int: Minimum size, in bytes, of an EA attribute to find its entries with
+the compiled scanner, smaller ones have too few entries to pay for the call'''
+_DATARUN_SPARSE = -0x8000000000000000
+'''int: Offset used to mark a sparse data run in ``DataRuns``'''
+
+_DATARUN_FIELD = struct.Struct("<Q")
+'''struct.Struct: Reads up to 8 bytes of a data run length or offset field'''
+_DATARUN_MASKS = tuple((1 << (8 * width)) - 1 for width in range(9))
+'''tuple(int): Mask that keeps the first ``width`` bytes of a data run field'''
+_DATARUN_SIGNS = (0,) + tuple(1 << (8 * width - 1) for width in range(1, 9))
+'''tuple(int): Sign bit of a data run offset field with ``width`` bytes'''
+_DATARUN_STRUCTS = {length_len | (length_offset << 4) : struct.Struct(f"<x{length_fmt}{offset_fmt}")
+    for length_len, length_fmt in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+        for length_offset, offset_fmt in ((1, "b"), (2, "h"), (4, "i"), (8, "q"))}
+'''dict(int : struct.Struct): Struct that reads a whole non sparse data run,
+header included, for the headers where both fields have a native width'''
+_STDINFO_V1_STRUCT = struct.Struct("<4Q4I")
+'''struct.Struct: STANDARD_INFORMATION content without the NTFS 3 extension'''
+_STDINFO_V1_UNPACK_FROM = _STDINFO_V1_STRUCT.unpack_from
+_IDX_E_VCN_STRUCT = struct.Struct("<Q")
+'''struct.Struct: VCN of the child node at the end of an index entry'''
+_IDX_E_VCN_UNPACK_FROM = _IDX_E_VCN_STRUCT.unpack_from
+
+class _EnumCache(dict):
+    '''Maps raw values to members of an enum, converting each value only once.
+
+    Invalid values are not cached and raise the same exception as the enum.
+    '''
+    __slots__ = ("_enum",)
+
+    def __init__(self, enum):
+        self._enum = enum
+
+    def __missing__(self, value):
+        member = self[value] = self._enum(value)
+        return member
+
+class _Lazy():
+    '''Defers a call until the object is converted to a string.
+
+    Used as a logging argument, so the value is only computed if a handler
+    actually formats the message.
+    '''
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func, *args):
+        self._func, self._args = func, args
+
+    def __str__(self):
+        return str(self._func(*self._args))
+
+if _np is not None:
+    _ATTR_HEADER_DTYPE = _np.dtype([("attr_type", "<u4"), ("attr_len", "<u4"),
+        ("non_resident", "u1"), ("name_len", "u1"), ("name_offset", "<u2"),
+        ("flags", "<u2"), ("attr_id", "<u2")])
+    _STDINFO_DTYPE = _np.dtype([("created", "<u8"), ("changed", "<u8"),
+        ("mft_changed", "<u8"), ("accessed", "<u8"), ("flags", "<u4"),
+        ("max_n_versions", "<u4"), ("version_number", "<u4"), ("class_id", "<u4"),
+        ("owner_id", "<u4"), ("security_id", "<u4"), ("quota_charged", "<u8"),
+        ("usn", "<u8")])
+else:
+    _ATTR_HEADER_DTYPE = _STDINFO_DTYPE = None
+'''numpy.dtype: Layouts of the basic attribute header and of STANDARD_INFORMATION,
+if numpy is available'''
+
+_ATTR_TYPE_CACHE = _EnumCache(AttrTypes)
+'''_EnumCache: Cache of ``AttrTypes`` members by attribute type id'''
+_ATTR_FLAGS_CACHE = _EnumCache(AttrFlags)
+'''_EnumCache: Cache of ``AttrFlags`` members by raw flags value'''
+_FILE_INFO_FLAGS_CACHE = _EnumCache(FileInfoFlags)
+'''_EnumCache: Cache of ``FileInfoFlags`` members by raw flags value'''
+_NAME_TYPE_CACHE = _EnumCache(NameType)
+'''_EnumCache: Cache of ``NameType`` members by name type id'''
+_COLLATION_RULE_CACHE = _EnumCache(CollationRule)
+'''_EnumCache: Cache of ``CollationRule`` members by collation rule id'''
+_INDEX_ENTRY_FLAGS_CACHE = _EnumCache(IndexEntryFlags)
+'''_EnumCache: Cache of ``IndexEntryFlags`` members by raw flags value'''
+_ACE_TYPE_CACHE = _EnumCache(ACEType)
+'''_EnumCache: Cache of ``ACEType`` members by ACE type id'''
+_ACE_CONTROL_FLAGS_CACHE = _EnumCache(ACEControlFlags)
+'''_EnumCache: Cache of ``ACEControlFlags`` members by raw flags value'''
+_ACE_ACCESS_FLAGS_CACHE = _EnumCache(ACEAccessFlags)
+'''_EnumCache: Cache of ``ACEAccessFlags`` members by raw access mask'''
 
 #******************************************************************************
 # MODULE LEVEL FUNCTIONS
@@ -71,13 +167,171 @@ def get_attr_info(binary_view):
         An tuple with the attribute type, the attribute length, in bytes, and
         if the attribute is resident or not.
     '''
-    global _ATTR_BASIC
+    attr_type, attr_len, non_resident = _ATTR_BASIC_UNPACK_FROM(binary_view)
+
+    return (_ATTR_TYPE_CACHE[attr_type], attr_len, non_resident != 0)
+
+def get_attr_info_raw(binary_view):
+    '''Same as ``get_attr_info``, but the attribute type is returned as the
+    raw ``int`` instead of an ``AttrTypes``.
+
+    Useful when the attribute type is only used to dispatch the processing
+    of the attribute.
+
+    Args:
+        binary_view (memoryview of bytearray) - A binary stream with the
+            information of the attribute
+
+    Returns:
+        An tuple with the attribute type id, the attribute length, in bytes, and
+        if the attribute is resident or not.
+    '''
+    attr_type, attr_len, non_resident = _ATTR_BASIC_UNPACK_FROM(binary_view)
+
+    return (attr_type, attr_len, non_resident != 0)
+
+def iter_attr_info_raw(binary_view, offset=0):
+    '''Walks all the attributes in a binary stream, returning the basic
+    information of each of them.
 
-    attr_type, attr_len, non_resident = _ATTR_BASIC.unpack(binary_view[:9])
+    Only the basic information, the same as ``get_attr_info_raw``, is read,
+    so the caller can decide which attributes need a full parse of the header.
+    The walk stops at the end marker, at an attribute with length zero or
+    when the stream ends.
+
+    Args:
+        binary_view (memoryview of bytearray) - A binary stream with the
+            attributes, normally the content of an MFT entry
+        offset (int) - Offset of the first attribute
+
+    Yields:
+        tuple: The offset of the attribute, the attribute type id, the attribute
+        length, in bytes, and if the attribute is resident or not.
+    '''
+    last_offset = len(binary_view) - _ATTR_BASIC.size
 
-    return (AttrTypes(attr_type), attr_len, bool(non_resident))
+    while offset <= last_offset:
+        attr_type, attr_len, non_resident = _ATTR_BASIC_UNPACK_FROM(binary_view, offset)
+        if attr_type == _ATTR_END_MARKER or not attr_len:
+            break
+        yield (offset, attr_type, attr_len, non_resident != 0)
+        offset += attr_len
+
+def _gather_records(binary_view, offsets, dtype):
+    '''Reads fixed size records from many offsets of a binary stream at once.
+
+    Args:
+        binary_view (memoryview of bytearray) - A binary stream with the records
+        offsets (iterable of int) - The offset of each record in the binary stream
+        dtype (numpy.dtype) - The layout of the record
+
+    Returns:
+        numpy.ndarray: A structured array with one element per offset
+
+    Raises:
+        ImportError: If numpy is not available
+    '''
+    if _np is None:
+        raise ImportError("numpy is required to read records in batch")
+    buffer = _np.frombuffer(binary_view, dtype=_np.uint8)
+    positions = _np.asarray(offsets, dtype=_np.intp)[:, None] + _np.arange(dtype.itemsize)
 
-def _create_attrcontent_class(name, fields, inheritance=(object,), data_structure=None, extra_functions=None, docstring=""):
+    return buffer[positions].view(dtype).reshape(-1)
+
+if _njit is not None:
+    @_njit(cache=True, nogil=True)
+    def _parse_dataruns(buf):
+        '''Compiled parser for the data runs of a non-resident attribute.
+
+        Args:
+            buf (numpy.ndarray of uint8) - The runlist, starting at the first
+                data run header
+
+        Returns:
+            A tuple with two int64 arrays, the lengths and the absolute offsets
+            of the data runs. Sparse data runs have ``_DATARUN_SPARSE`` as offset.
+
+        Raises:
+            ValueError: If a field is wider than 8 bytes or a value does not
+                fit in an int64, the caller must decode the runlist with the
+                pure python parser
+        '''
+        size = buf.shape[0]
+        lengths = _np.empty(size // 2 + 1, _np.int64)
+        offsets = _np.empty(size // 2 + 1, _np.int64)
+        count = 0
+        offset = 0
+        previous_dr_offset = 0
+
+        while offset < size and buf[offset] != 0:
+            header = buf[offset]
+            length_len = header & 0x0F
+            length_offset = header >> 4
+            if length_len > 8 or length_offset > 8:
+                raise ValueError("Data run field wider than 8 bytes")
+            start = offset + 1
+            if start + length_len + length_offset > size:
+                break
+
+            dr_length = 0
+            for i in range(length_len):
+                dr_length |= _np.int64(buf[start + i]) << (8 * i)
+            if dr_length < 0:
+                raise ValueError("Data run length does not fit in an int64")
+            start += length_len
+            if length_offset:
+                dr_offset = 0
+                for i in range(length_offset):
+                    dr_offset |= _np.int64(buf[start + i]) << (8 * i)
+                if length_offset < 8 and buf[start + length_offset - 1] & 0x80:
+                    dr_offset -= _np.int64(1) << (8 * length_offset)
+                if (dr_offset > 0 and previous_dr_offset > 0x7FFFFFFFFFFFFFFF - dr_offset) or \
+                        (dr_offset < 0 and previous_dr_offset < _DATARUN_SPARSE - dr_offset):
+                    raise ValueError("Data run offset does not fit in an int64")
+                previous_dr_offset += dr_offset
+                offsets[count] = previous_dr_offset
+            else:
+                offsets[count] = _DATARUN_SPARSE
+            lengths[count] = dr_length
+            count += 1
+            offset = start + length_offset
+
+        return lengths[:count], offsets[:count]
+
+    @_njit(cache=True, nogil=True)
+    def _scan_ea_offsets(buf):
+        '''Compiled scanner for the offsets of the entries of an EA attribute.
+
+        The scan stops at the end of the buffer or at an entry whose offset
+        to the next entry is smaller than the entry header (8 bytes).
+
+        Args:
+            buf (numpy.ndarray of uint8) - The content of the EA attribute
+
+        Returns:
+            numpy.ndarray of int64: The offset of each entry
+        '''
+        size = buf.shape[0]
+        offsets = _np.empty(size // 8 + 1, _np.int64)
+        count = 0
+        offset = 0
+
+        while offset < size:
+            offsets[count] = offset
+            count += 1
+            if offset + 4 > size:
+                break
+            next_ea = _np.int64(buf[offset]) | (_np.int64(buf[offset + 1]) << 8) \
+                | (_np.int64(buf[offset + 2]) << 16) | (_np.int64(buf[offset + 3]) << 24)
+            if next_ea < 8:
+                break
+            offset += next_ea
+
+        return offsets[:count]
+else:
+    _parse_dataruns = _scan_ea_offsets = None
+
+def _create_attrcontent_class(name, fields, inheritance=(object,), data_structure=None, extra_functions=None, docstring="", hashable=False, extra_slots=()):
     '''Helper function that creates a class for attribute contents.
 
     This function creates is a boilerplate to create all the expected methods of
@@ -85,8 +339,11 @@ def _create_attrcontent_class(name, fields, inheritance=(object,), data_structur
 
     Once it executes it defines a dynamic class with the methods "__init__",
     "__repr__" and "__eq__" based on the fields passed in the ``fields`` parameter.
+    The "__init__" receives one argument per field, in the same order and named
+    after the field without leading underscores, all of them defaulting to ``None``.
     If the ``data_structure`` parameter is present, the classmethod ``get_representation_size``
-    and the class variable ``_REPR`` will also be present.
+    and the class variables ``_REPR``, ``_REPR_UNPACK_FROM`` and ``_REPR_SIZE``
+    will also be present.
 
     It is also possible to define the inheritance using this method by passing
     a list of classes in the ``inheritance`` parameter.
@@ -94,6 +351,14 @@ def _create_attrcontent_class(name, fields, inheritance=(object,), data_structur
     If the ``extra_functions`` argument is present, they will be added to the
     class.
 
+    If ``hashable`` is True, the class also gets a "__hash__" based on the fields.
+    The hash is computed only once and cached in the ``_hash`` slot, so the fields
+    must not change after the object is used as a key.
+
+    The ``extra_slots`` are added to the class' slots and initialized to ``None``,
+    but they are not constructor arguments and are not part of "__repr__",
+    "__eq__" or "__hash__".
+
     Note:
         If the ``extra_functions`` has defined any of dinamically created methods,
         they will *replace* the ones created.
@@ -108,57 +373,48 @@ def _create_attrcontent_class(name, fields, inheritance=(object,), data_structur
             will be the name of the function in the class and the content
             of the key is a function that will be bound to the class
         doctring (str): Class' docstring
+        hashable (bool): If the class should have a cached "__hash__"
+        extra_slots (tuple(str)): Slots that are not fields, initialized to ``None``
 
     Returns:
         A new class with the ``name`` as it's name.
     '''
 
-    def create_func_from_str(f_name, args, content, docstring=""):
-        '''Helper function to create functions from strings.
-
-        To improve performance, the standard functions are created at runtime
-        based on the string derived from the content. This way the function, from
-        the interpreter point of view, looks like statically defined.
-
-        Note:
-            This function should be used only for methods that will receive
-            ``self`` (instace methods). The ``self`` argument is added automatically.
-
-        Args:
-            f_name (str): Function name
-            args (list(str)): List of extra arguments that the function will receive
-            content (str): Content of the function
-            docstring (str): Function's docstring
-
-        Returns:
-            A new function object that can be inserted in the class.
-        '''
-        exec_namespace = {"__name__" : f"{f_name}"}
-        new_args = ", ".join(["self"] + args)
-        func_str = f"def {f_name}({new_args}): {content}"
-        exec(func_str, exec_namespace)
-        func = exec_namespace[f_name]
-        func.__doc__ = docstring
-
-        return func
-
     #creates the functions necessary for the new class
-    slots = fields
-
-    init_content = ", ".join([f"self.{field}" for field in fields]) + " = content"
-    __init__ = create_func_from_str("__init__", [f"content=(None,)*{len(fields)}"],  init_content)
-
-    temp = ", ".join([f"{field}={{self.{field}}}" for field in fields])
-    repr = "return " + f"f\'{{self.__class__.__name__}}({temp})\'"
-    __repr__ = create_func_from_str("__repr__", [],  repr)
-
-    temp = " and ".join([f"self.{field} == other.{field}" for field in fields])
-    eq = f"return {temp} if isinstance(other, {name}) else False"
-    __eq__ = create_func_from_str("__eq__", ["other"], eq)
+    slots = fields + extra_slots + ("_hash",) if hashable else fields + extra_slots
+
+    args = [field.lstrip("_") for field in fields]
+    init_args = ", ".join([f"{arg}=None" for arg in args])
+    init_content = "; ".join([f"self.{field} = {arg}" for field, arg in zip(fields, args)] +
+                             [f"self.{slot} = None" for slot in extra_slots])
+    if hashable:
+        init_content += "; self._hash = None"
+    repr_content = ", ".join([f"{field}={{self.{field}}}" for field in fields])
+    eq_content = " and ".join([f"self.{field} == other.{field}" for field in fields])
+
+    #To improve performance, the standard methods are generated from a single
+    #source string and compiled once per class. This way the methods, from the
+    #interpreter point of view, look like statically defined. The class name
+    #is a constant in the namespace and the class itself is added as ``_CLS``
+    #after creation, so the methods don't need to go through ``self.__class__``.
+    methods_str = "\n".join([
+        f"def __init__(self, {init_args}): {init_content}",
+        f"def __repr__(self): return f\'{{_CLS_NAME}}({repr_content})\'",
+        f"def __eq__(self, other): return {eq_content} if type(other) is _CLS else False"])
+    if hashable:
+        hash_content = "".join([f"self.{field}, " for field in fields])
+        methods_str += "\n".join(["",
+            "def __hash__(self):",
+            "    if self._hash is None:",
+            f"        self._hash = hash(({hash_content}))",
+            "    return self._hash"])
+    exec_namespace = {"__name__" : name, "_CLS_NAME" : name, "_CLS" : None}
+    exec(methods_str, exec_namespace)
+    __init__, __repr__, __eq__ = exec_namespace["__init__"], exec_namespace["__repr__"], exec_namespace["__eq__"]
 
     @classmethod
     def get_representation_size(cls):
-        return cls._REPR.size
+        return cls._REPR_SIZE
 
     #adapted from namedtuple code
     # Modify function metadata to help with introspection and debugging
@@ -172,8 +428,14 @@ def _create_attrcontent_class(name, fields, inheritance=(object,), data_structur
                  "__repr__" : __repr__,
                  "__eq__" : __eq__
                  }
+    if hashable:
+        __hash__ = exec_namespace["__hash__"]
+        __hash__.__qualname__ = f'{name}.__hash__'
+        namespace["__hash__"] = __hash__
     if data_structure is not None:
         namespace["_REPR"] = struct.Struct(data_structure)
+        namespace["_REPR_UNPACK_FROM"] = namespace["_REPR"].unpack_from
+        namespace["_REPR_SIZE"] = namespace["_REPR"].size
         namespace["get_representation_size"] = get_representation_size
     if docstring:
         namespace["__doc__"] = docstring
@@ -195,6 +457,7 @@ def _create_attrcontent_class(name, fields, inheritance=(object,), data_structur
     #TODO check if docstring was provided, issue a warning
 
     new_class = type(name, inheritance, namespace)
+    exec_namespace["_CLS"] = new_class
 
     # adapted from namedtuple code
     # For pickling to work, the __module__ variable needs to be set to the frame
@@ -252,6 +515,13 @@ class DataRuns():
     Great resource for explanation and tests:
     https://flatcap.org/linux-ntfs/ntfs/concepts/data_runs.html
 
+    The data runs are stored as two parallel arrays of 64 bits integers, one
+    with the lengths and other with the absolute offsets, where sparse data
+    runs have the offset ``_DATARUN_SPARSE``. They are numpy arrays if the
+    compiled parser is available, ``array.array`` otherwise. Iterating or
+    indexing the object still returns ``(length, offset)`` tuples, with ``None``
+    as the offset of a sparse data run.
+
     Important:
         Calling ``len`` in this class returns the number of data runs, not the
         size in bytes.
@@ -262,15 +532,27 @@ class DataRuns():
             length of the data run and the second is the absolute offset
 
     Attributes:
+        lengths (array of int) - The length of each data run
+        offsets (array of int) - The absolute offset of each data run
         data_runs (list of tuples) - A list of tuples representing the data run.
             The tuple has to have 2 elements, where the first element is the
             length of the data run and the second is the absolute offset
     '''
-    _INFO = struct.Struct("<B")
+    __slots__ = ("lengths", "offsets")
 
-    def __init__(self, data_runs=[]):
+    def __init__(self, data_runs=None):
         '''See class docstring.'''
-        self.data_runs = data_runs #list of tuples
+        self.data_runs = data_runs if data_runs is not None else []
+
+    @property
+    def data_runs(self):
+        '''list of tuples: The data runs as ``(length, offset)`` tuples'''
+        return list(iter(self))
+
+    @data_runs.setter
+    def data_runs(self, data_runs):
+        self.lengths = _array("q", [dr_length for dr_length, dr_offset in data_runs])
+        self.offsets = _array("q", [_DATARUN_SPARSE if dr_offset is None else dr_offset for dr_length, dr_offset in data_runs])
 
     @classmethod
     def create_from_binary(cls, binary_view):
@@ -286,25 +568,64 @@ class DataRuns():
             DataRuns: New object using hte binary stream as source
         '''
         nw_obj = cls()
+        if _parse_dataruns is not None:
+            try:
+                nw_obj.lengths, nw_obj.offsets = _parse_dataruns(_np.frombuffer(binary_view, dtype=_np.uint8))
+            except ValueError:
+                #corrupt runlists may have fields wider than 8 bytes, only
+                #the code below can decode them
+                pass
+            else:
+                _MOD_LOGGER.debug("DataRuns object created successfully")
+                return nw_obj
+
         offset = 0
         previous_dr_offset = 0
-        header_size = cls._INFO.size #"header" of a data run is always a byte
-
-        while binary_view[offset] != 0:   #the runlist ends with an 0 as the "header"
-            header = cls._INFO.unpack(binary_view[offset:offset+header_size])[0]
-            length_len = header & 0x0F
-            length_offset = (header & 0xF0) >> 4
-
-            temp_len = offset+header_size+length_len #helper variable just to make things simpler
-            dr_length = int.from_bytes(binary_view[offset+header_size:temp_len], "little", signed=False)
-            if length_offset: #the offset is relative to the previous data run
-                dr_offset = int.from_bytes(binary_view[temp_len:temp_len+length_offset], "little", signed=True) + previous_dr_offset
-                previous_dr_offset = dr_offset
-            else: #if it is sparse, requires a a different approach
-                dr_offset = None
-            offset += header_size + length_len + length_offset
-            nw_obj.data_runs.append((dr_length, dr_offset))
-            #nw_obj.data_runs.append(DataRun(dr_length, dr_offset))
+        header_size = 1 #"header" of a data run is always a byte
+        #indexing bytes is cheaper than a memoryview in this loop. The padding
+        #guarantees a full 8 byte field can be read after the last data run
+        buffer = binary_view.tobytes() + bytes(8)
+        unpack_from = _DATARUN_FIELD.unpack_from
+        lengths, offsets = _array("q"), _array("q")
+        append_length, append_offset = lengths.append, offsets.append
+        run_struct = _DATARUN_STRUCTS.get
+
+        #lengths and offsets are stored as int64, corrupt runlists may not fit
+        try:
+            while buffer[offset] != 0:   #the runlist ends with an 0 as the "header"
+                header = buffer[offset]
+                run = run_struct(header)
+                if run is not None: #common run shapes are read with a single unpack
+                    dr_length, dr_offset = run.unpack_from(buffer, offset)
+                    append_length(dr_length)
+                    previous_dr_offset += dr_offset
+                    append_offset(previous_dr_offset)
+                    offset += run.size
+                    continue
+                length_len = header & 0x0F
+                length_offset = (header & 0xF0) >> 4
+
+                temp_len = offset+header_size+length_len #helper variable just to make things simpler
+                if length_len > 8 or length_offset > 8: #only corrupt runlists have fields this wide
+                    append_length(int.from_bytes(buffer[offset+header_size:temp_len], "little", signed=False))
+                    if length_offset:
+                        previous_dr_offset += int.from_bytes(buffer[temp_len:temp_len+length_offset], "little", signed=True)
+                        append_offset(previous_dr_offset)
+                    else:
+                        append_offset(_DATARUN_SPARSE)
+                    offset += header_size + length_len + length_offset
+                    continue
+                append_length(unpack_from(buffer, offset+header_size)[0] & _DATARUN_MASKS[length_len])
+                if length_offset: #the offset is relative to the previous data run
+                    sign = _DATARUN_SIGNS[length_offset]
+                    previous_dr_offset += ((unpack_from(buffer, temp_len)[0] & _DATARUN_MASKS[length_offset]) ^ sign) - sign
+                    append_offset(previous_dr_offset)
+                else: #if it is sparse, requires a a different approach
+                    append_offset(_DATARUN_SPARSE)
+                offset += header_size + length_len + length_offset
+        except OverflowError as err:
+            raise ContentError(f"Data run at offset {offset} has a length or offset that does not fit in 64 bits") from err
+        nw_obj.lengths, nw_obj.offsets = lengths, offsets
 
         _MOD_LOGGER.debug("DataRuns object created successfully")
 
@@ -312,15 +633,19 @@ class DataRuns():
 
     def __len__(self):
         '''Returns the number of data runs'''
-        return len(self.data_runs)
+        return len(self.lengths)
 
     def __iter__(self):
         '''Return the iterator for the representation of the list.'''
-        return iter(self.data_runs)
+        for dr_length, dr_offset in zip(self.lengths.tolist(), self.offsets.tolist()):
+            yield (dr_length, None if dr_offset == _DATARUN_SPARSE else dr_offset)
 
     def __getitem__(self, index):
         '''Return a specific data run'''
-        return _getitem(self.data_runs, index)
+        if isinstance(index, slice):
+            return self.data_runs[index]
+        dr_offset = int(self.offsets[index])
+        return (int(self.lengths[index]), None if dr_offset == _DATARUN_SPARSE else dr_offset)
 
     def __repr__(self):
         'Return a nicely formatted representation string'
@@ -366,15 +691,29 @@ class BaseAttributeHeader():
         Flags - 2 (AttrFlags)
         Attribute id - 2
     '''
+    _REPR_UNPACK_FROM = _REPR.unpack_from
+    _REPR_SIZE = _REPR.size
 
     __slots__ = ("attr_type_id", "attr_len", "non_resident", "flags", "attr_id",
-        "attr_name")
+        "_attr_name", "_raw_name")
 
     def __init__(self, content=(None,)*6):
         '''See class docstring.'''
         self.attr_type_id, self.attr_len, self.non_resident, self.flags, self.attr_id, \
         self.attr_name = content
 
+    @property
+    def attr_name(self):
+        '''str: Attribute name, decoded from utf_16_le on the first access'''
+        if self._raw_name is not None:
+            self._attr_name = _utf16le(self._raw_name, "strict", True)[0]
+            self._raw_name = None
+        return self._attr_name
+
+    @attr_name.setter
+    def attr_name(self, name):
+        self._attr_name = name
+        self._raw_name = None
 
     @classmethod
     def create_from_binary(cls, binary_view):
@@ -389,21 +728,44 @@ class BaseAttributeHeader():
         Returns:
             BaseAttributeHeader: New object using hte binary stream as source
         '''
-        attr_type, attr_len, non_resident, name_len, name_offset, flags, attr_id = cls._REPR.unpack(binary_view[:cls._REPR.size])
+        attr_type, attr_len, non_resident, name_len, name_offset, flags, attr_id = cls._REPR_UNPACK_FROM(binary_view, 0)
 
-        if name_len:
-            name = binary_view[name_offset:name_offset+(2*name_len)].tobytes().decode("utf_16_le")
-        else:
-            name = None
+        #the name is only decoded if it is accessed, see ``attr_name``
+        raw_name = binary_view[name_offset:name_offset+(2*name_len)].tobytes() if name_len else None
 
-        nw_obj = cls((AttrTypes(attr_type), attr_len, bool(non_resident), AttrFlags(flags), attr_id, name ))
+        nw_obj = cls((_ATTR_TYPE_CACHE[attr_type], attr_len, bool(non_resident), _ATTR_FLAGS_CACHE[flags], attr_id, None ))
+        nw_obj._raw_name = raw_name
 
         return nw_obj
 
+    @classmethod
+    def create_many(cls, binary_view, offsets):
+        '''Reads the basic header of many attributes at once.
+
+        Instead of creating one object per attribute, returns a numpy structured
+        array with the raw values (``attr_type``, ``attr_len``, ``non_resident``,
+        ``name_len``, ``name_offset``, ``flags`` and ``attr_id``) of each header.
+        Nothing is converted to the enums and names are not decoded, the caller
+        can do it for the attributes it actually needs.
+
+        Args:
+            binary_view (memoryview of bytearray) - A binary stream with the
+                attributes
+            offsets (iterable of int) - The offset of each attribute in the
+                binary stream
+
+        Returns:
+            numpy.ndarray: One element per offset, in the same order
+
+        Raises:
+            ImportError: If numpy is not available
+        '''
+        return _gather_records(binary_view, offsets, _ATTR_HEADER_DTYPE)
+
     @classmethod
     def get_representation_size(cls):
         '''Return the header size WITHOUT accounting for a possible named attribute.'''
-        return cls._REPR.size
+        return cls._REPR_SIZE
 
     def __len__(self):
         '''Returns the logical size of the attribute'''
@@ -453,6 +815,8 @@ class ResidentAttrHeader(BaseAttributeHeader):
         Indexed flag - 1
         Padding - 1
     '''
+    _REPR_UNPACK_FROM = _REPR.unpack_from
+    _REPR_SIZE = _REPR.size
 
     __slots__ = ("content_len", "content_offset", "indexed_flag")
 
@@ -464,7 +828,7 @@ class ResidentAttrHeader(BaseAttributeHeader):
     @classmethod
     def get_representation_size(cls):
         '''Return the header size WITHOUT accounting for a possible named attribute.'''
-        return cls._REPR.size
+        return cls._REPR_SIZE
 
     @classmethod
     def create_from_binary(cls, binary_view):
@@ -480,15 +844,14 @@ class ResidentAttrHeader(BaseAttributeHeader):
             AttributeHeader: New object using hte binary stream as source
         '''
         attr_type, attr_len, non_resident, name_len, name_offset, flags, attr_id, \
-        content_len, content_offset, indexed_flag = cls._REPR.unpack(binary_view[:cls._REPR.size])
+        content_len, content_offset, indexed_flag = cls._REPR_UNPACK_FROM(binary_view, 0)
 
-        if name_len:
-            name = binary_view[name_offset:name_offset+(2*name_len)].tobytes().decode("utf_16_le")
-        else:
-            name = None
+        #the name is only decoded if it is accessed, see ``attr_name``
+        raw_name = binary_view[name_offset:name_offset+(2*name_len)].tobytes() if name_len else None
 
-        nw_obj = cls((AttrTypes(attr_type), attr_len, bool(non_resident), AttrFlags(flags), attr_id, name),
+        nw_obj = cls((_ATTR_TYPE_CACHE[attr_type], attr_len, bool(non_resident), _ATTR_FLAGS_CACHE[flags], attr_id, None),
                         (content_len, content_offset, indexed_flag))
+        nw_obj._raw_name = raw_name
 
         return nw_obj
 
@@ -525,6 +888,8 @@ class NonResidentAttrHeader(BaseAttributeHeader):
         Initialized size of the stream - 8
         Data runs - dynamic
     '''
+    _REPR_UNPACK_FROM = _REPR.unpack_from
+    _REPR_SIZE = _REPR.size
 
     __slots__ = ("start_vcn", "end_vcn", "rl_offset", "compress_usize", "alloc_sstream", "curr_sstream", "init_sstream", "data_runs")
 
@@ -555,7 +920,7 @@ class NonResidentAttrHeader(BaseAttributeHeader):
     @classmethod
     def get_representation_size(cls):
         '''Return the header size, does not account for the number of data runs'''
-        return cls._REPR.size
+        return cls._REPR_SIZE
 
     @classmethod
     def create_from_binary(cls, load_dataruns, binary_view):
@@ -575,16 +940,15 @@ class NonResidentAttrHeader(BaseAttributeHeader):
         '''
         attr_type, attr_len, non_resident, name_len, name_offset, flags, attr_id, \
             start_vcn, end_vcn, rl_offset, compress_usize, alloc_sstream, curr_sstream, \
-            init_sstream = cls._REPR.unpack(binary_view[:cls._REPR.size])
+            init_sstream = cls._REPR_UNPACK_FROM(binary_view, 0)
 
-        if name_len:
-            name = binary_view[name_offset:name_offset+(2*name_len)].tobytes().decode("utf_16_le")
-        else:
-            name = None
+        #the name is only decoded if it is accessed, see ``attr_name``
+        raw_name = binary_view[name_offset:name_offset+(2*name_len)].tobytes() if name_len else None
 
         #content = cls._REPR.unpack(binary_view[non_resident_offset:non_resident_offset+cls._REPR.size])
-        nw_obj = cls((AttrTypes(attr_type), attr_len, bool(non_resident), AttrFlags(flags), attr_id, name),
+        nw_obj = cls((_ATTR_TYPE_CACHE[attr_type], attr_len, bool(non_resident), _ATTR_FLAGS_CACHE[flags], attr_id, None),
             (start_vcn, end_vcn, rl_offset, compress_usize, alloc_sstream, curr_sstream, init_sstream))
+        nw_obj._raw_name = raw_name
 
         if load_dataruns:
             nw_obj.data_runs = DataRuns.create_from_binary(binary_view[nw_obj.rl_offset:])
@@ -613,15 +977,20 @@ class NonResidentAttrHeader(BaseAttributeHeader):
 #******************************************************************************
 # ABSTRACT CLASS FOR ATTRIBUTE CONTENT
 #******************************************************************************
-class AttributeContentBase(metaclass=ABCMeta):
+class AttributeContentBase():
     '''Base class for attribute's content.
 
-    This class is an interface to all the attribute's contents. It can't be
-    instantiated and serves only a general interface.
+    This class is an interface to all the attribute's contents and serves only
+    a general interface. It is a plain class, instead of an abstract one, to
+    keep ``isinstance`` checks against the hierarchy cheap.
+
+    The class has no instance attributes, so the content classes created by
+    ``_create_attrcontent_class`` only have the slots of their fields and no
+    ``__dict__``.
     '''
+    __slots__ = ()
 
     @classmethod
-    @abstractmethod
     def create_from_binary(cls, binary_stream):
         '''Creates an object from from a binary stream.
 
@@ -632,48 +1001,45 @@ class AttributeContentBase(metaclass=ABCMeta):
         Returns:
             A new object of whatever type has overloaded the method.
         '''
-        pass
+        raise NotImplementedError(f"{cls.__name__} must implement create_from_binary")
 
-    @abstractmethod
     def __len__(self):
         '''Get the actual size of the content, in bytes, as some attributes have variable sizes.'''
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement __len__")
 
-    @abstractmethod
     def __eq__(self, other):
-        pass
+        return NotImplemented
 
 class AttributeContentNoRepr(AttributeContentBase):
     '''Base class for attribute's content that don't have a fixed representation.
 
-    This class is an interface to the attribute's contents. It can't be
-    instantiated and serves only a general interface.
+    This class is an interface to the attribute's contents and serves only a
+    general interface.
     '''
-    pass
+    __slots__ = ()
 
 class AttributeContentRepr(AttributeContentBase):
     '''Base class for attribute's content that don't have a fixed representation.
 
-    This class is an interface to the attribute's contents. It can't be
-    instantiated and serves only a general interface.
+    This class is an interface to the attribute's contents and serves only a
+    general interface.
     '''
+    __slots__ = ()
 
     @classmethod
-    @abstractmethod
     def get_representation_size(cls):
         '''Get the representation size, in bytes, based on defined struct
 
         Returns:
             An ``int`` with the size of the structure
         '''
-        pass
-
+        raise NotImplementedError(f"{cls.__name__} must implement get_representation_size")
 
 #******************************************************************************
 # TIMESTAMPS class
 #******************************************************************************
 def _len_ts(self):
-    return Timestamps._REPR.size
+    return Timestamps._REPR_SIZE
 
 def _from_binary_ts(cls, binary_stream):
     """See base class."""
@@ -683,12 +1049,11 @@ def _from_binary_ts(cls, binary_stream):
         raise ContentError("Invalid binary stream size")
 
     content = repr.unpack(binary_stream)
-    nw_obj = cls()
-    nw_obj.created, nw_obj.changed, nw_obj.mft_changed, nw_obj.accessed = \
-        convert_filetime(content[0]), convert_filetime(content[1]), \
-        convert_filetime(content[2]), convert_filetime(content[3])
+    nw_obj = cls(_convert_filetime(content[0]), _convert_filetime(content[1]),
+        _convert_filetime(content[2]), _convert_filetime(content[3]))
 
-    _MOD_LOGGER.debug("Attempted to unpack Timestamp from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Timestamp from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
@@ -706,13 +1071,8 @@ def _astimezone_ts(self, timezone):
     if self.created.tzinfo is timezone:
         return self
     else:
-        nw_obj = Timestamps((None,)*4)
-        nw_obj.created = self.created.astimezone(timezone)
-        nw_obj.changed = self.changed.astimezone(timezone)
-        nw_obj.mft_changed = self.mft_changed.astimezone(timezone)
-        nw_obj.accessed = self.accessed.astimezone(timezone)
-
-        return nw_obj
+        return Timestamps(self.created.astimezone(timezone), self.changed.astimezone(timezone),
+            self.mft_changed.astimezone(timezone), self.accessed.astimezone(timezone))
 
 _docstring_ts = '''Represents a group of timestamps based on how MFT records.
 
@@ -721,15 +1081,14 @@ e.g., created, changed, mft change and accessed. All attributes are time zone
 aware.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`datetime`): Created timestamp
-    content[1] (datetime): Changed timestamp
-    content[2] (datetime): MFT change timestamp
-    content[3] (datetime): Accessed timestamp
+    created (:obj:`datetime`): Created timestamp
+    changed (datetime): Changed timestamp
+    mft_changed (datetime): MFT change timestamp
+    accessed (datetime): Accessed timestamp
 
 Attributes:
     created (datetime): A datetime with the created timestamp
@@ -745,13 +1104,37 @@ _ts_namespace = {"__len__" : _len_ts,
 
 Timestamps = _create_attrcontent_class("Timestamps", ("created", "changed", "mft_changed", "accessed"),
         inheritance=(AttributeContentRepr,), data_structure="<4Q",
-        extra_functions=_ts_namespace, docstring=_docstring_ts)
+        extra_functions=_ts_namespace, docstring=_docstring_ts, hashable=True)
 
 #******************************************************************************
 # STANDARD_INFORMATION ATTRIBUTE
 #******************************************************************************
 def _len_stdinfo(self):
-    return StandardInformation._TIMESTAMP_SIZE + StandardInformation._REPR.size
+    #only the NTFS 3 version of the content has the owner id
+    if self.owner_id is None:
+        return _STDINFO_V1_STRUCT.size
+    return StandardInformation._REPR_SIZE
+
+def _decode_stdinfo_v3(cls, binary_stream):
+    '''Decodes a STANDARD_INFORMATION with the NTFS 3 extension'''
+    t_created, t_changed, t_mft_changed, t_accessed, flags, m_ver, ver, \
+        c_id, o_id, s_id, quota_charged, usn = cls._REPR_UNPACK_FROM(binary_stream)
+
+    return cls(
+            Timestamps(_convert_filetime(t_created), _convert_filetime(t_changed),
+                        _convert_filetime(t_mft_changed), _convert_filetime(t_accessed)
+        ), _FILE_INFO_FLAGS_CACHE[flags], m_ver, ver, c_id, o_id, s_id, quota_charged, usn)
+
+def _decode_stdinfo_v1(cls, binary_stream):
+    '''Decodes a STANDARD_INFORMATION without the NTFS 3 extension'''
+    #if the content is not using v3 extension, added the missing stuff for consistency
+    t_created, t_changed, t_mft_changed, t_accessed, flags, m_ver, ver, \
+        c_id  = _STDINFO_V1_UNPACK_FROM(binary_stream)
+
+    return cls(
+            Timestamps(_convert_filetime(t_created), _convert_filetime(t_changed),
+                        _convert_filetime(t_mft_changed), _convert_filetime(t_accessed)
+        ), _FILE_INFO_FLAGS_CACHE[flags], m_ver, ver, c_id, None, None, None, None)
 
 def _from_binary_stdinfo(cls, binary_stream):
     """See base class."""
@@ -771,23 +1154,12 @@ def _from_binary_stdinfo(cls, binary_stream):
         Update Sequence Number (USN) - 8 (NTFS 3+)
     '''
 
-    if len(binary_stream) == cls._REPR.size: #check if it is v3 by size of the stram
-        t_created, t_changed, t_mft_changed, t_accessed, flags, m_ver, ver, \
-            c_id, o_id, s_id, quota_charged, usn = cls._REPR.unpack(binary_stream)
-        nw_obj = cls(
-            (   Timestamps((convert_filetime(t_created), convert_filetime(t_changed),
-                            convert_filetime(t_mft_changed), convert_filetime(t_accessed))
-            ), FileInfoFlags(flags), m_ver, ver, c_id, o_id, s_id, quota_charged, usn))
-    else:
-        #if the content is not using v3 extension, added the missing stuff for consistency
-        t_created, t_changed, t_mft_changed, t_accessed, flags, m_ver, ver, \
-            c_id  = cls._REPR_NO_NFTS_3_EXTENSION.unpack(binary_stream)
-        nw_obj = cls(
-            (   Timestamps((convert_filetime(t_created), convert_filetime(t_changed),
-                            convert_filetime(t_mft_changed), convert_filetime(t_accessed))
-            ), FileInfoFlags(flags), m_ver, ver, c_id, None, None, None, None))
+    #the version is identified by the size of the stream, anything that is
+    #not v3 is handled as the version without the extension
+    nw_obj = cls._DECODERS.get(len(binary_stream), _decode_stdinfo_v1)(cls, binary_stream)
 
-    _MOD_LOGGER.debug("Attempted to unpack STANDARD_INFORMATION from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack STANDARD_INFORMATION from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
@@ -797,21 +1169,20 @@ Has all the data structures to represent a STANDARD_INFORMATION attribute,
 allowing everything to be accessed with python objects/types.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`Timestamps`): Timestamp object
-    content[1] (:obj:`FileInfoFlags`): A FIleInfoFlags object with the flags
+    timestamps (:obj:`Timestamps`): Timestamp object
+    flags (:obj:`FileInfoFlags`): A FIleInfoFlags object with the flags
         for this object
-    content[2] (int): Maximum number of allowed versions
-    content[3] (int): Current version number
-    content[4] (int): Class id
-    content[5] (int): Owner id
-    content[6] (int): Security id
-    content[7] (int): Quota charged
-    content[8] (int): Update Sequence Number (USN)
+    max_n_versions (int): Maximum number of allowed versions
+    version_number (int): Current version number
+    class_id (int): Class id
+    owner_id (int): Owner id
+    security_id (int): Security id
+    quota_charged (int): Quota charged
+    usn (int): Update Sequence Number (USN)
 
 Attributes:
     timestamps (:obj:`Timestamps`): All attribute's timestamps
@@ -825,9 +1196,35 @@ Attributes:
     usn (int): Update Sequence Number (USN)
 '''
 
+def _create_many_stdinfo(cls, binary_view, offsets):
+    '''Reads many STANDARD_INFORMATION contents at once.
+
+    Instead of creating one object per content, returns a numpy structured
+    array with the raw values of each content, with the same names as the
+    class attributes. The timestamps are kept as FILETIME and the flags as
+    ``int``, the caller converts only what it needs.
+
+    Note:
+        Only the NTFS 3 version of the content (72 bytes) is supported.
+
+    Args:
+        binary_view (memoryview of bytearray) - A binary stream with the
+            contents
+        offsets (iterable of int) - The offset of each content in the
+            binary stream
+
+    Returns:
+        numpy.ndarray: One element per offset, in the same order
+
+    Raises:
+        ImportError: If numpy is not available
+    '''
+    return _gather_records(binary_view, offsets, _STDINFO_DTYPE)
+
 _stdinfo_namespace = {"__len__" : _len_stdinfo,
                  "create_from_binary" : classmethod(_from_binary_stdinfo),
-                 "_REPR_NO_NFTS_3_EXTENSION" : struct.Struct("<4Q4I")
+                 "create_many" : classmethod(_create_many_stdinfo),
+                 "_REPR_NO_NFTS_3_EXTENSION" : _STDINFO_V1_STRUCT
                  }
 
 StandardInformation = _create_attrcontent_class("StandardInformation",
@@ -835,12 +1232,18 @@ StandardInformation = _create_attrcontent_class("StandardInformation",
                 "owner_id", "security_id", "quota_charged", "usn"),
         inheritance=(AttributeContentRepr,), data_structure="<4Q4I2I2Q",
         extra_functions=_stdinfo_namespace, docstring=_docstring_stdinfo)
+StandardInformation._DECODERS = {StandardInformation._REPR_SIZE : _decode_stdinfo_v3,
+                _STDINFO_V1_STRUCT.size : _decode_stdinfo_v1}
 
 #******************************************************************************
 # ATTRIBUTE_LIST ATTRIBUTE
 #******************************************************************************
-def _from_binary_attrlist_e(cls, binary_stream):
-    """See base class."""
+def _from_binary_attrlist_e(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the entry starts in ``binary_stream``, this
+    allows parsing all the entries without slicing the stream.
+    """
     '''
         Attribute type - 4
         Length of a particular entry - 2
@@ -852,15 +1255,16 @@ def _from_binary_attrlist_e(cls, binary_stream):
         Name (unicode) - variable
     '''
 
-    attr_type, entry_len, name_len, name_off, s_vcn, f_tag, attr_id = cls._REPR.unpack(binary_stream[:cls._REPR.size])
+    attr_type, entry_len, name_len, name_off, s_vcn, f_tag, attr_id = cls._REPR_UNPACK_FROM(binary_stream, offset)
     if name_len:
-        name = binary_stream[name_off:name_off+(2*name_len)].tobytes().decode("utf_16_le")
+        name = str(binary_stream[offset+name_off:offset+name_off+(2*name_len)], "utf_16_le")
     else:
         name = None
     file_ref, file_seq = get_file_reference(f_tag)
-    nw_obj = cls((AttrTypes(attr_type), entry_len, name_off, s_vcn, file_ref, file_seq, attr_id, name))
+    nw_obj = cls(_ATTR_TYPE_CACHE[attr_type], entry_len, name_off, s_vcn, file_ref, file_seq, attr_id, name)
 
-    _MOD_LOGGER.debug("Attempted to unpack ATTRIBUTE_LIST Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack ATTRIBUTE_LIST Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[offset:offset+entry_len]), nw_obj)
 
     return nw_obj
 
@@ -874,20 +1278,18 @@ Has all the data structures to represent one entry of the ATTRIBUTE_LIST
 content allowing everything to be accessed with python objects/types.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`AttrTypes`): Type of the attribute in the entry
-    content[1] (int): Length of the entry, in bytes
-    content[2] (int): Length of the name, in bytes
-    content[3] (int): Offset to the name, in bytes
-    content[4] (int): Start VCN
-    content[5] (int): File reference number
-    content[6] (int): File sequence number
-    content[7] (int): Attribute ID
-    content[8] (int): Name
+    attr_type (:obj:`AttrTypes`): Type of the attribute in the entry
+    entry_len (int): Length of the entry, in bytes
+    name_offset (int): Offset to the name, in bytes
+    start_vcn (int): Start VCN
+    file_ref (int): File reference number
+    file_seq (int): File sequence number
+    attr_id (int): Attribute ID
+    name (int): Name
 
 Attributes:
     attr_type (:obj:`Timestamps`): Type of the attribute in the entry
@@ -911,55 +1313,45 @@ AttributeListEntry = _create_attrcontent_class("AttributeListEntry",
 
 #-----------------------------------------------------------------------------
 
-def _from_binary_attrlist(cls, binary_stream):
-    """See base class."""
-    _attr_list = []
-    offset = 0
-
-    while True:
-        entry = AttributeListEntry.create_from_binary(binary_stream[offset:])
-        offset += len(entry)
-        _attr_list.append(entry)
-        if offset >= len(binary_stream):
-            break
-        _MOD_LOGGER.debug("Next AttributeListEntry offset = %d", offset)
-    _MOD_LOGGER.debug("Attempted to unpack ATTRIBUTE_LIST Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), _attr_list)
-
-    return cls(_attr_list)
-
-def _len_attrlist(self):
-    '''Return the number of entries in the attribute list'''
-    return len(self._attr_list)
-
-def _iter_attrlist(self):
-    return iter(self._attr_list)
-
-def _gitem_attrlist(self, index):
-    return _getitem(self._attr_list, index)
+class AttributeList(list, AttributeContentNoRepr):
+    '''Represents the contents for the ATTRIBUTE_LIST attribute.
 
-_docstring_attrlist = '''Represents the contents for the ATTRIBUTE_LIST attribute.
+    Is a list of AttributeListEntry. It is a subclass of ``list``, so
+    iterating, indexing and ``len()`` work directly on the list.
 
-Is a list of AttributeListEntry. It behaves as list in python, you can iterate
-over it, access by member, etc.
+    Important:
+        Using the ``len()`` method on the objects of this class returns the number
+        of elements in the list.
 
-Important:
-    Using the ``len()`` method on the objects of this class returns the number
-    of elements in the list.
+    Args:
+        content (list(:obj:`AttributeListEntry`)): List of AttributeListEntry
+    '''
+    __slots__ = ()
 
-Args:
-    content (list(:obj:`AttributeListEntry`)): List of AttributeListEntry
-'''
+    @classmethod
+    def create_from_binary(cls, binary_stream):
+        """See base class."""
+        nw_obj = cls()
+        append = nw_obj.append
+        offset = 0
+        stream_len = len(binary_stream)
+        create_entry = AttributeListEntry.create_from_binary
+
+        while True:
+            entry = create_entry(binary_stream, offset)
+            offset += entry._entry_len
+            append(entry)
+            if offset >= stream_len:
+                break
+            _MOD_LOGGER.debug("Next AttributeListEntry offset = %d", offset)
+        if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+            _MOD_LOGGER.debug("Attempted to unpack ATTRIBUTE_LIST Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
-_attrlist_namespace = {"__len__" : _len_attrlist,
-                       "__iter__" : _iter_attrlist,
-                       "__getitem__" : _gitem_attrlist,
-                       "create_from_binary" : classmethod(_from_binary_attrlist)
-                 }
+        return nw_obj
 
-AttributeList = _create_attrcontent_class("AttributeList",
-            ("_attr_list",),
-        inheritance=(AttributeContentNoRepr,), data_structure=None,
-        extra_functions=_attrlist_namespace, docstring=_docstring_attrlist)
+    def __repr__(self):
+        'Return a nicely formatted representation string'
+        return f'{self.__class__.__name__}({list.__repr__(self)})'
 
 #******************************************************************************
 # OBJECT_ID ATTRIBUTE
@@ -970,19 +1362,24 @@ def _from_binary_objid(cls, binary_stream):
 
     #some entries might not have all four ids, this line forces
     #to always create 4 elements, so contruction is easier
-    uids = [UUID(bytes_le=binary_stream[i*uid_size:(i+1)*uid_size].tobytes()) if i * uid_size < len(binary_stream) else None for i in range(0,4)]
-    _MOD_LOGGER.debug("Attempted to unpack OBJECT_ID Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), uids)
+    buffer = binary_stream.tobytes()
+    uids = [UUID(bytes_le=buffer[i:i+uid_size]) for i in range(0, min(len(buffer), 4 * uid_size), uid_size)]
+    size = len(uids) * uid_size
+    uids += [None] * (4 - len(uids))
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack OBJECT_ID Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), uids)
+
+    nw_obj = cls(*uids)
+    nw_obj._size = size
 
-    return cls(uids)
+    return nw_obj
 
 def _len_objid(self):
     '''Get the actual size of the content, as some attributes have variable sizes'''
-    try:
-        return self._size
-    except AttributeError:
+    if self._size is None:
         temp = (self.object_id, self.birth_vol_id, self.birth_object_id, self.birth_domain_id)
         self._size = sum([ObjectID._UUID_SIZE for data in temp if data is not None])
-        return self._size
+    return self._size
 
 _docstring_objid = '''Represents the content of the OBJECT_ID attribute.
 
@@ -991,15 +1388,14 @@ Important:
     in this case the code creates None entries.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`UUID`): Object id
-    content[1] (:obj:`UUID`): Birth volume id
-    content[2] (:obj:`UUID`): Birth object id
-    content[3] (:obj:`UUID`): Birth domain id
+    object_id (:obj:`UUID`): Object id
+    birth_vol_id (:obj:`UUID`): Birth volume id
+    birth_object_id (:obj:`UUID`): Birth object id
+    birth_domain_id (:obj:`UUID`): Birth domain id
 
 Attributes:
     object_id (UUID): Unique ID assigned to file
@@ -1016,7 +1412,7 @@ _objid_namespace = {"__len__" : _len_objid,
 ObjectID = _create_attrcontent_class("ObjectID",
             ("object_id", "birth_vol_id", "birth_object_id", "birth_domain_id"),
         inheritance=(AttributeContentNoRepr,), data_structure=None,
-        extra_functions=_objid_namespace, docstring=_docstring_objid)
+        extra_functions=_objid_namespace, docstring=_docstring_objid, extra_slots=("_size",))
 
 
 #******************************************************************************
@@ -1024,15 +1420,21 @@ ObjectID = _create_attrcontent_class("ObjectID",
 #******************************************************************************
 def _from_binary_volname(cls, binary_stream):
     """See base class."""
-    name = binary_stream.tobytes().decode("utf_16_le")
+    name = str(binary_stream, "utf_16_le")
 
-    _MOD_LOGGER.debug("Attempted to unpack VOLUME_NAME Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), name)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack VOLUME_NAME Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), name)
 
-    return cls(name)
+    nw_obj = cls(name)
+    nw_obj._size = len(binary_stream)
+
+    return nw_obj
 
 def _len_volname(self):
     """Returns the size of the attribute, in bytes, encoded in utf_16_le"""
-    return len(self.name.encode("utf_16_le"))
+    if self._size is None:
+        self._size = len(self.name.encode("utf_16_le"))
+    return self._size
 
 _docstring_volname = """Represents the content of the VOLUME_NAME attribute.
 
@@ -1050,25 +1452,25 @@ _volname_namespace = {"__len__" : _len_volname,
 VolumeName = _create_attrcontent_class("VolumeName",
             ("name", ),
         inheritance=(AttributeContentNoRepr,), data_structure=None,
-        extra_functions=_volname_namespace, docstring=_docstring_volname)
+        extra_functions=_volname_namespace, docstring=_docstring_volname, extra_slots=("_size",))
 
 #******************************************************************************
 # VOLUME_INFORMATION ATTRIBUTE
 #******************************************************************************
 def _from_binary_volinfo(cls, binary_stream):
     """See base class."""
-    content = cls._REPR.unpack(binary_stream)
+    major_ver, minor_ver, vol_flags = cls._REPR_UNPACK_FROM(binary_stream)
 
-    nw_obj = cls(content)
-    nw_obj.vol_flags = VolumeFlags(content[2])
+    nw_obj = cls(major_ver, minor_ver, VolumeFlags(vol_flags))
 
-    _MOD_LOGGER.debug("Attempted to unpack VOLUME_INFORMATION Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), content)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack VOLUME_INFORMATION Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_volinfo(self):
     '''Returns the length of the attribute'''
-    return VolumeInformation._REPR.size
+    return VolumeInformation._REPR_SIZE
 
 _docstring_volinfo = '''Represents the content of the VOLUME_INFORMATION attribute
 
@@ -1076,14 +1478,13 @@ Interprets the volume information as per viewed by MFT. Contains information
 like version and the state of the volume.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Major version
-    content[1] (int): Minor version
-    content[2] (:obj:`VolumeFlags`): Volume flags
+    major_ver (int): Major version
+    minor_ver (int): Minor version
+    vol_flags (:obj:`VolumeFlags`): Volume flags
 
 Attributes:
     major_ver (int): Major version
@@ -1121,21 +1522,26 @@ def _from_binary_filename(cls, binary_stream):
     '''
 
     f_tag, t_created, t_changed, t_mft_changed, t_accessed, alloc_fsize, \
-        real_fsize, flags, reparse_value, name_len, name_type = cls._REPR.unpack(binary_stream[:cls._REPR.size])
-    name = binary_stream[cls._REPR.size:].tobytes().decode("utf_16_le")
+        real_fsize, flags, reparse_value, name_len, name_type = cls._REPR_UNPACK_FROM(binary_stream)
+    size = cls._REPR_SIZE + 2 * name_len
+    name = str(binary_stream[cls._REPR_SIZE:size], "utf_16_le")
     file_ref, file_seq = get_file_reference(f_tag)
 
-    nw_obj = cls((file_ref, file_seq,
-           Timestamps((convert_filetime(t_created), convert_filetime(t_changed),
-                        convert_filetime(t_mft_changed), convert_filetime(t_accessed))
-        ), alloc_fsize, real_fsize, FileInfoFlags(flags), reparse_value, NameType(name_type), name))
+    nw_obj = cls(file_ref, file_seq,
+           Timestamps(_convert_filetime(t_created), _convert_filetime(t_changed),
+                        _convert_filetime(t_mft_changed), _convert_filetime(t_accessed)
+        ), alloc_fsize, real_fsize, _FILE_INFO_FLAGS_CACHE[flags], reparse_value, _NAME_TYPE_CACHE[name_type], name)
+    nw_obj._size = size
 
-    _MOD_LOGGER.debug("Attempted to unpack FILENAME from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack FILENAME from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_filename(self):
-    return  FileName._REPR.size + len(name.encode("utf_16_le"))
+    if self._size is None:
+        self._size = FileName._REPR_SIZE + len(self.name.encode("utf_16_le"))
+    return self._size
 
 _docstring_filename = '''Represents the content of a FILENAME attribute.
 
@@ -1149,21 +1555,19 @@ Warning:
     reliable information, use the ``Datastream`` objects in the api module.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Parent reference
-    content[1] (int): Parent sequence
-    content[2] (:obj:`Timestamps`): Filename timestamps
-    content[3] (int): Allocated size of the file
-    content[4] (int): Logica/Real file size
-    content[5] (:obj:`FileInfoFlags`): File flags
-    content[6] (int): Reparse value
-    content[7] (int): Name length
-    content[8] (:obj:`NameType`): Name type
-    content[9] (str): Name
+    parent_ref (int): Parent reference
+    parent_seq (int): Parent sequence
+    timestamps (:obj:`Timestamps`): Filename timestamps
+    alloc_file_size (int): Allocated size of the file
+    real_file_size (int): Logica/Real file size
+    flags (:obj:`FileInfoFlags`): File flags
+    reparse_value (int): Reparse value
+    name_type (:obj:`NameType`): Name type
+    name (str): Name
 
 Attributes:
     parent_ref (int): Parent refence
@@ -1185,7 +1589,7 @@ FileName = _create_attrcontent_class("FileName",
             ("parent_ref", "parent_seq", "timestamps", "alloc_file_size",
             "real_file_size", "flags", "reparse_value", "name_type", "name"),
         inheritance=(AttributeContentRepr,), data_structure="<7Q2I2B",
-        extra_functions=_filename_namespace, docstring=_docstring_filename)
+        extra_functions=_filename_namespace, docstring=_docstring_filename, extra_slots=("_size",))
 
 #******************************************************************************
 # DATA ATTRIBUTE
@@ -1229,14 +1633,15 @@ def _from_binary_idx_nh(cls, binary_stream):
         Offset to end of the allocated index entry - 4
         Flags - 4
     '''
-    nw_obj = cls(cls._REPR.unpack(binary_stream[:cls._REPR.size]))
+    nw_obj = cls(*cls._REPR_UNPACK_FROM(binary_stream))
 
-    _MOD_LOGGER.debug("Attempted to unpack Index Node Header Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Index Node Header Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_idx_nh(self):
-    return IndexNodeHeader._REPR.size
+    return IndexNodeHeader._REPR_SIZE
 
 _docstring_idx_nh = '''Represents the Index Node Header, that is always present in the INDEX_ROOT
 and INDEX_ALLOCATION attribute.
@@ -1245,15 +1650,14 @@ The composition of an INDEX_ROOT and INDEX_ALLOCATION always start with
 a header. This class represents this header.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Start offset
-    content[1] (int): End offset
-    content[2] (int): Allocated size of the node
-    content[3] (int): Non-leaf node Flag (has subnodes)
+    start_offset (int): Start offset
+    end_offset (int): End offset
+    end_alloc_offset (int): Allocated size of the node
+    flags (int): Non-leaf node Flag (has subnodes)
 
 Attributes:
     start_offset (int): Start offset
@@ -1273,8 +1677,21 @@ IndexNodeHeader = _create_attrcontent_class("IndexNodeHeader",
 
 #------------------------------------------------------------------------------
 
-def _from_binary_idx_e(cls, binary_stream, content_type=None):
-    """See base class."""
+class _LazyFileName():
+    '''Holds the raw bytes of a FILENAME inside an ``IndexEntry`` until the
+    content is accessed for the first time.
+    '''
+    __slots__ = ("binary",)
+
+    def __init__(self, binary):
+        self.binary = binary
+
+def _from_binary_idx_e(cls, binary_stream, content_type=None, lazy=False):
+    """See base class.
+
+    If ``lazy`` is True, a FILENAME content is only parsed when the ``content``
+    is accessed.
+    """
     #TODO don't save this here and overload later?
     #TODO confirm if this is really generic or is always a file reference
     ''' Undefined - 8
@@ -1284,49 +1701,78 @@ def _from_binary_idx_e(cls, binary_stream, content_type=None):
         Content - variable
         VCN of child node - 8 (exists only if flag is set, aligned to a 8 byte boundary)
     '''
-    repr_size = cls._REPR.size
-    generic, entry_len, cont_len, flags = cls._REPR.unpack(binary_stream[:repr_size])
+    repr_size = cls._REPR_SIZE
+    generic, entry_len, cont_len, flags = cls._REPR_UNPACK_FROM(binary_stream)
     vcn_child_node = (None,)
 
     #if content is known (filename), create a new object to represent the content
     if content_type is AttrTypes.FILE_NAME and cont_len:
-        binary_content = FileName.create_from_binary(binary_stream[repr_size:repr_size+cont_len])
+        if lazy:
+            binary_content = _LazyFileName(binary_stream[repr_size:repr_size+cont_len].tobytes())
+        else:
+            binary_content = FileName.create_from_binary(binary_stream[repr_size:repr_size+cont_len])
     else:
         binary_content = binary_stream[repr_size:repr_size+cont_len].tobytes()
     #if there is a next entry, we need to pad it to a 8 byte boundary
     if flags & IndexEntryFlags.CHILD_NODE_EXISTS:
         temp_size = repr_size + cont_len
-        boundary_fix = (entry_len - temp_size) % 8
-        vcn_child_node = cls._REPR_VCN.unpack(binary_stream[temp_size+boundary_fix:temp_size+boundary_fix+8])
+        #entries are aligned to 8 bytes, so this is the padding up to the boundary
+        boundary_fix = -temp_size & 7
+        vcn_child_node = _IDX_E_VCN_UNPACK_FROM(binary_stream, temp_size+boundary_fix)
 
-    nw_obj = cls((generic, entry_len, cont_len, IndexEntryFlags(flags), binary_content, vcn_child_node))
+    nw_obj = cls(generic, entry_len, cont_len, _INDEX_ENTRY_FLAGS_CACHE[flags], binary_content, vcn_child_node)
 
-    _MOD_LOGGER.debug("Attempted to unpack Index Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Index Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_idx_e(self):
     return self._entry_len
 
+def _get_content_idx_e(self):
+    '''FileName or bytes: Content of the entry'''
+    if type(self._content) is _LazyFileName:
+        self._content = FileName.create_from_binary(memoryview(self._content.binary))
+    return self._content
+
+def _set_content_idx_e(self, content):
+    self._content = content
+
+def _eq_idx_e(self, other):
+    #goes through the ``content`` property, so a lazy entry compares the same
+    #way as an entry that was parsed eagerly
+    if type(other) is not IndexEntry:
+        return False
+    return self.generic == other.generic and self._entry_len == other._entry_len \
+        and self.content_len == other.content_len and self.flags == other.flags \
+        and self.content == other.content and self.vcn_child_node == other.vcn_child_node
+
+def _repr_idx_e(self):
+    '''Return a nicely formatted representation string'''
+    return (f'{self.__class__.__name__}(generic={self.generic}, _entry_len={self._entry_len}, '
+        f'content_len={self.content_len}, flags={self.flags}, content={self.content}, '
+        f'vcn_child_node={self.vcn_child_node})')
+
 _docstring_idx_e = '''Represents an entry in the index.
 
 An Index, from the MFT perspective is composed of multiple entries. This class
 represents these entries. Normally entries contain a FILENAME attribute.
 Note the entry can have other types of content, for these cases the class
-saves the raw bytes
+saves the raw bytes. If the entry is created with ``lazy=True``, the FILENAME
+is only parsed on the first access to ``content``.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): File reference?
-    content[1] (int): Length of the entry
-    content[2] (int): Length of the content
-    content[3] (:obj:`IndexEntryFlags`): Flags
-    content[4] (:obj:`FileName` or bytes): Content of the entry
-    content[5] (int): VCN child node
+    generic (int): File reference?
+    entry_len (int): Length of the entry
+    content_len (int): Length of the content
+    flags (:obj:`IndexEntryFlags`): Flags
+    content (:obj:`FileName` or bytes): Content of the entry
+    vcn_child_node (int): VCN child node
 
 Attributes:
     generic (int): File reference?
@@ -1337,50 +1783,57 @@ Attributes:
 '''
 
 _idx_e_namespace = {"__len__" : _len_idx_e,
-                    "_REPR_VCN" : struct.Struct("<Q"),
+                    "content" : property(_get_content_idx_e, _set_content_idx_e),
+                    "__eq__" : _eq_idx_e,
+                    "__repr__" : _repr_idx_e,
+                    "_REPR_VCN" : _IDX_E_VCN_STRUCT,
                     "create_from_binary" : classmethod(_from_binary_idx_e)
                  }
 
 IndexEntry = _create_attrcontent_class("IndexEntry",
-            ("generic", "_entry_len", "content_len", "flags", "content", "vcn_child_node"),
+            ("generic", "_entry_len", "content_len", "flags", "_content", "vcn_child_node"),
         inheritance=(AttributeContentRepr,), data_structure="<Q2HI",
         extra_functions=_idx_e_namespace, docstring=_docstring_idx_e)
 
 #------------------------------------------------------------------------------
 
 
-def _from_binary_idx_root(cls, binary_stream):
-    """See base class."""
+def _from_binary_idx_root(cls, binary_stream, lazy=False):
+    """See base class.
+
+    The ``lazy`` argument is passed to each ``IndexEntry``.
+    """
     ''' Attribute type - 4
         Collation rule - 4
         Bytes per index record - 4
         Clusters per index record - 1
         Padding - 3
     '''
-    attr_type, collation_rule, b_per_idx_r, c_per_idx_r = cls._REPR.unpack(binary_stream[:cls._REPR.size])
-    node_header = IndexNodeHeader.create_from_binary(binary_stream[cls._REPR.size:])
-    attr_type = AttrTypes(attr_type) if attr_type else None
+    attr_type, collation_rule, b_per_idx_r, c_per_idx_r = cls._REPR_UNPACK_FROM(binary_stream)
+    node_header = IndexNodeHeader.create_from_binary(binary_stream[cls._REPR_SIZE:])
+    attr_type = _ATTR_TYPE_CACHE[attr_type] if attr_type else None
     index_entry_list = []
 
-    offset = cls._REPR.size + node_header.start_offset
+    offset = cls._REPR_SIZE + node_header.start_offset
     #loads all index entries related to the root node
     while True:
-        entry = IndexEntry.create_from_binary(binary_stream[offset:], attr_type)
+        entry = IndexEntry.create_from_binary(binary_stream[offset:], attr_type, lazy)
         index_entry_list.append(entry)
         if entry.flags & IndexEntryFlags.LAST_ENTRY:
             break
         else:
             offset += len(entry)
 
-    nw_obj = cls((attr_type, CollationRule(collation_rule), b_per_idx_r,
-                    c_per_idx_r, node_header, index_entry_list ))
+    nw_obj = cls(attr_type, _COLLATION_RULE_CACHE[collation_rule], b_per_idx_r,
+                    c_per_idx_r, node_header, index_entry_list )
 
-    _MOD_LOGGER.debug("Attempted to unpack INDEX_ROOT Entry from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack INDEX_ROOT Entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_idx_root(self):
-    return IndexRoot._REPR.size
+    return IndexRoot._REPR_SIZE
 
 
 _docstring_idx_root = '''Represents the content of a INDEX_ROOT attribute.
@@ -1388,17 +1841,16 @@ _docstring_idx_root = '''Represents the content of a INDEX_ROOT attribute.
 The structure of an index is a B+ tree, as such an root is always present.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`AttrTypes`): Attribute type
-    content[1] (:obj:`CollationRule`): Collation rule
-    content[2] (int): Index record size in bytes
-    content[3] (int): Index record size in clusters
-    node_header (IndexNodeHeader) - Node header related to this index root
-    idx_entry_list (list(IndexEntry))- List of index entries that belong to
+    attr_type (:obj:`AttrTypes`): Attribute type
+    collation_rule (:obj:`CollationRule`): Collation rule
+    index_len_in_bytes (int): Index record size in bytes
+    index_len_in_cluster (int): Index record size in clusters
+    node_header (IndexNodeHeader): Node header related to this index root
+    index_entry_list (list(IndexEntry)): List of index entries that belong to
         this index root
 
 Attributes:
@@ -1428,13 +1880,21 @@ def _allocated_entries_bitmap(self):
     '''Creates a generator that returns all allocated entries in the
     bitmap.
 
+    The bitmap is read in words of 8 bytes, so empty regions are skipped
+    a word at a time and only the set bits of a word are visited.
+
     Yields:
         int: The bit index of the allocated entries.
 
     '''
-    for entry_number in range(len(self._bitmap) * 8):
-        if self.entry_allocated(entry_number):
-            yield entry_number
+    bitmap = self._bitmap
+    for word_offset in range(0, len(bitmap), 8):
+        word = int.from_bytes(bitmap[word_offset:word_offset+8], "little")
+        base = word_offset << 3
+        while word:
+            lowest = word & -word
+            yield base + lowest.bit_length() - 1
+            word ^= lowest
 
 def _entry_allocated_bitmap(self, entry_number):
     """Checks if a particular index is allocated.
@@ -1454,12 +1914,12 @@ def _get_next_empty_bitmap(self):
     Returns:
         int: The value of the empty entry
     """
-    #TODO probably not the best way, redo
-    for i, byte in enumerate(self._bitmap):
-        if byte != 255:
-            for offset in range(8):
-                if not byte & (1 << offset):
-                    return (i * 8) + offset
+    bitmap = self._bitmap
+    for word_offset in range(0, len(bitmap), 8):
+        word = bitmap[word_offset:word_offset+8]
+        free = ~int.from_bytes(word, "little") & ((1 << (len(word) * 8)) - 1)
+        if free:
+            return (word_offset << 3) + (free & -free).bit_length() - 1
 
 def _from_binary_bitmap(cls, binary_stream):
     """See base class."""
@@ -1504,22 +1964,29 @@ def _from_binary_junc_mnt(cls, binary_stream):
         Length of print name - 2
     '''
     offset_target_name, len_target_name, offset_print_name, len_print_name = \
-        cls._REPR.unpack(binary_stream[:cls._REPR.size])
+        cls._REPR_UNPACK_FROM(binary_stream)
+    repr_size = cls._REPR_SIZE
 
-    offset = cls._REPR.size + offset_target_name
-    target_name = binary_stream[offset:offset+len_target_name].tobytes().decode("utf_16_le")
-    offset = cls._REPR.size + offset_print_name
-    print_name = binary_stream[offset:offset+len_print_name].tobytes().decode("utf_16_le")
+    offset = repr_size + offset_target_name
+    target_name = _utf16le(binary_stream[offset:offset+len_target_name], "strict", True)[0]
+    offset = repr_size + offset_print_name
+    print_name = _utf16le(binary_stream[offset:offset+len_print_name], "strict", True)[0]
 
-    nw_obj = cls((target_name, print_name))
+    nw_obj = cls(target_name, print_name)
+    #the names may be apart and NUL terminated, the content ends with the last one
+    nw_obj._size = repr_size + max(offset_target_name + len_target_name, offset_print_name + len_print_name)
 
-    _MOD_LOGGER.debug("Attempted to unpack Junction or MNT point from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Junction or MNT point from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_junc_mnt(self):
-    '''Returns the size of the bitmap in bytes'''
-    return len(self.target_name.encode("utf_16_le")) + len(self.print_nameencode("utf_16_le"))  + 4 #size of offsets
+    '''Returns the size of the content in bytes'''
+    if self._size is None:
+        self._size = JunctionOrMount._REPR_SIZE + len(self.target_name.encode("utf_16_le")) \
+            + len(self.print_name.encode("utf_16_le"))
+    return self._size
 
 _docstring_junc_mnt = """Represents the content of a REPARSE_POINT attribute when it is a junction
 or mount point.
@@ -1540,7 +2007,7 @@ _junc_mnt_namespace = {"__len__" : _len_junc_mnt,
 JunctionOrMount = _create_attrcontent_class("JunctionOrMount",
             ("target_name", "print_name"),
         inheritance=(AttributeContentRepr,), data_structure="<4H",
-        extra_functions=_junc_mnt_namespace, docstring=_docstring_junc_mnt)
+        extra_functions=_junc_mnt_namespace, docstring=_docstring_junc_mnt, extra_slots=("_size",))
 
 #------------------------------------------------------------------------------
 
@@ -1554,22 +2021,29 @@ def _from_binary_syn_link(cls, binary_stream):
     '''
     offset_target_name, len_target_name, offset_print_name, \
     len_print_name, syn_flags = \
-        cls._REPR.unpack(binary_stream[:cls._REPR.size])
+        cls._REPR_UNPACK_FROM(binary_stream)
+    repr_size = cls._REPR_SIZE
 
-    offset = cls._REPR.size + offset_target_name
-    target_name = binary_stream[offset:offset+len_target_name].tobytes().decode("utf_16_le")
-    offset = cls._REPR.size + offset_print_name
-    print_name = binary_stream[offset:offset+len_print_name].tobytes().decode("utf_16_le")
+    offset = repr_size + offset_target_name
+    target_name = _utf16le(binary_stream[offset:offset+len_target_name], "strict", True)[0]
+    offset = repr_size + offset_print_name
+    print_name = _utf16le(binary_stream[offset:offset+len_print_name], "strict", True)[0]
 
-    nw_obj = cls((target_name, print_name, SymbolicLinkFlags(syn_flags)))
+    nw_obj = cls(target_name, print_name, SymbolicLinkFlags(syn_flags))
+    #the names may be apart and NUL terminated, the content ends with the last one
+    nw_obj._size = repr_size + max(offset_target_name + len_target_name, offset_print_name + len_print_name)
 
-    _MOD_LOGGER.debug("Attempted to unpack Symbolic Link from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Symbolic Link from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_syn_link(self):
-    '''Returns the size of the bitmap in bytes'''
-    return len(self.target_name.encode("utf_16_le")) + len(self.print_nameencode("utf_16_le"))  + 8 #size of offsets + flags
+    '''Returns the size of the content in bytes'''
+    if self._size is None:
+        self._size = SymbolicLink._REPR_SIZE + len(self.target_name.encode("utf_16_le")) \
+            + len(self.print_name.encode("utf_16_le"))
+    return self._size
 
 _docstring_syn_link = """Represents the content of a REPARSE_POINT attribute when it is a
 symbolic link.
@@ -1592,7 +2066,7 @@ _syn_link_namespace = {"__len__" : _len_syn_link,
 SymbolicLink = _create_attrcontent_class("SymbolicLink",
             ("target_name", "print_name", "symbolic_flags"),
         inheritance=(AttributeContentRepr,), data_structure="<4HI",
-        extra_functions=_syn_link_namespace, docstring=_docstring_junc_mnt)
+        extra_functions=_syn_link_namespace, docstring=_docstring_syn_link, extra_slots=("_size",))
 
 #------------------------------------------------------------------------------
 
@@ -1606,7 +2080,8 @@ def _from_binary_reparse(cls, binary_stream):
         Padding - 2
     '''
     #content = cls._REPR.unpack(binary_view[:cls._REPR.size])
-    reparse_tag, data_len = cls._REPR.unpack(binary_stream[:cls._REPR.size])
+    reparse_tag, data_len = cls._REPR_UNPACK_FROM(binary_stream)
+    repr_size = cls._REPR_SIZE
 
     #reparse_tag (type, flags) data_len, guid, data
     reparse_type = ReparseType(reparse_tag & 0x0000FFFF)
@@ -1614,24 +2089,25 @@ def _from_binary_reparse(cls, binary_stream):
     guid = None #guid exists only in third party reparse points
     if reparse_flags & ReparseFlags.IS_MICROSOFT:#a microsoft tag
         if reparse_type is ReparseType.SYMLINK:
-            data = SymbolicLink.create_from_binary(binary_stream[cls._REPR.size:])
+            data = SymbolicLink.create_from_binary(binary_stream[repr_size:])
         elif reparse_type is ReparseType.MOUNT_POINT:
-            data = JunctionOrMount.create_from_binary(binary_stream[cls._REPR.size:])
+            data = JunctionOrMount.create_from_binary(binary_stream[repr_size:])
         else:
-            data = binary_stream[cls._REPR.size:].tobytes()
+            data = binary_stream[repr_size:].tobytes()
     else:
-        guid = UUID(bytes_le=binary_stream[cls._REPR.size:cls._REPR.size+16].tobytes())
-        data = binary_stream[cls._REPR.size+16:].tobytes()
+        guid = UUID(bytes_le=binary_stream[repr_size:repr_size+16].tobytes())
+        data = binary_stream[repr_size+16:].tobytes()
 
-    nw_obj = cls((reparse_type, reparse_flags, data_len, guid, data))
+    nw_obj = cls(reparse_type, reparse_flags, data_len, guid, data)
 
-    _MOD_LOGGER.debug("Attempted to unpack REPARSE_POINT from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack REPARSE_POINT from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_reparse(self):
     '''Returns the size of the bitmap in bytes'''
-    return ReparsePoint._REPR.size + self.data_len
+    return ReparsePoint._REPR_SIZE + self.data_len
 
 _docstring_reparse = '''Represents the content of a REPARSE_POINT attribute.
 
@@ -1648,16 +2124,15 @@ However, as of now, only two have been implemented:
 As for third-party data, this is always saved in raw (bytes).
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`ReparseType`): Reparse point type
-    content[1] (:obj:`ReparseFlags`): Reparse point flags
-    content[2] (int): Reparse data length
-    content[3] (:obj:`UUID`): GUID
-    content[4] (*variable*): Content of the reparse type
+    reparse_type (:obj:`ReparseType`): Reparse point type
+    reparse_flags (:obj:`ReparseFlags`): Reparse point flags
+    data_len (int): Reparse data length
+    guid (:obj:`UUID`): GUID
+    data (*variable*): Content of the reparse type
 
 Attributes:
     reparse_type (:obj:`ReparseType`): Reparse point type
@@ -1687,10 +2162,10 @@ def _from_binary_ea_info(cls, binary_stream):
         Number of Extended Attributes which have NEED_EA set - 2
         Size of extended attribute data - 4
     '''
-    return cls(cls._REPR.unpack(binary_stream[:cls._REPR.size]))
+    return cls(*cls._REPR_UNPACK_FROM(binary_stream))
 
 def _len_ea_info(self):
-    return EaInformation._REPR.size
+    return EaInformation._REPR_SIZE
 
 _docstring_ea_info = '''Represents the content of a EA_INFORMATION attribute.
 
@@ -1698,14 +2173,13 @@ The (HPFS) extended attribute information ($EA_INFORMATION) contains
 information about the extended attribute ($EA).
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Size of the EA attribute entry
-    content[1] (int): Number of EA attributes with NEED_EA set
-    content[2] (int): Size of the EA data
+    entry_len (int): Size of the EA attribute entry
+    ea_set_number (int): Number of EA attributes with NEED_EA set
+    ea_size (int): Size of the EA data
 
 Attributes:
     entry_len (int): Size of the EA attribute entry
@@ -1726,30 +2200,36 @@ EaInformation = _create_attrcontent_class("EaInformation",
 # EA ATTRIBUTE
 #******************************************************************************
 
-def _from_binary_ea_entry(cls, binary_stream):
-    """See base class."""
+def _from_binary_ea_entry(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the entry starts in ``binary_stream``, this
+    allows parsing all the entries without slicing the stream.
+    """
     ''' Offset to the next EA  - 4
         Flags - 1
         Name length - 1
         Value length - 2
     '''
-    offset_next_ea, flags, name_len, value_len = cls._REPR.unpack(binary_stream[:cls._REPR.size])
+    repr_size = cls._REPR_SIZE
+    offset_next_ea, flags, name_len, value_len = cls._REPR_UNPACK_FROM(binary_stream, offset)
 
-    name = binary_stream[cls._REPR.size:cls._REPR.size + name_len].tobytes().decode("ascii")
+    name = str(binary_stream[offset+repr_size:offset+repr_size+name_len], "ascii")
     #it looks like the value is 8 byte aligned, do some math to compensate
     #TODO confirm if this is true
-    value_alignment = (_ceil((cls._REPR.size + name_len) / 8) * 8)
+    value_alignment = offset + ((repr_size + name_len + 7) & ~7)
     value = binary_stream[value_alignment:value_alignment + value_len].tobytes()
 
-    nw_obj = cls((offset_next_ea, EAFlags(flags), name, value))
+    nw_obj = cls(offset_next_ea, EAFlags(flags), name, value)
 
-    _MOD_LOGGER.debug("Attempted to unpack EA entry from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack EA entry from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[offset:]), nw_obj)
 
     return nw_obj
 
 def _len_ea_entry(self):
     '''Returns the size of the entry'''
-    return EaEntry._REPR.size + len(self.name.encode("ascii")) + self.value_len
+    return EaEntry._REPR_SIZE + len(self.name) + len(self.value)
 
 _docstring_ea_entry = '''Represents an entry for EA.
 
@@ -1763,15 +2243,14 @@ Warning:
     not have all the data.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Offset to the next EA
-    content[1] (:obj:`EAFlags`): Changed timestamp
-    content[2] (str): Name of the EA attribute
-    content[3] (bytes): Value of the attribute
+    offset_next_ea (int): Offset to the next EA
+    flags (:obj:`EAFlags`): Changed timestamp
+    name (str): Name of the EA attribute
+    value (bytes): Value of the attribute
 
 Attributes:
     offset_next_ea (int): Offset to next extended attribute entry.
@@ -1797,29 +2276,40 @@ def _from_binary_ea(cls, binary_stream):
     _ea_list = []
     offset = 0
 
-    #_MOD_LOGGER.debug(f"Creating Ea object from binary stream {binary_stream.tobytes()}...")
-    _MOD_LOGGER.debug("Creating Ea object from binary '%s'...", binary_stream.tobytes())
-    while True:
-        entry = EaEntry.create_from_binary(binary_stream[offset:])
-        offset += entry.offset_next_ea
-        _ea_list.append(entry)
-        if offset >= len(binary_stream):
-            break
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Creating Ea object from binary '%s'...", _Lazy(bytes, binary_stream))
+    create_entry = EaEntry.create_from_binary
+    stream_len = len(binary_stream)
+    if _scan_ea_offsets is not None and stream_len >= _EA_SCAN_MIN_SIZE:
+        _ea_list = [create_entry(binary_stream, entry_offset)
+            for entry_offset in _scan_ea_offsets(_np.frombuffer(binary_stream, dtype=_np.uint8)).tolist()]
+    else:
+        header_size = EaEntry._REPR_SIZE
+        while True:
+            entry = create_entry(binary_stream, offset)
+            _ea_list.append(entry)
+            #an offset smaller than the header is invalid and would loop forever
+            if entry.offset_next_ea < header_size:
+                break
+            offset += entry.offset_next_ea
+            if offset >= stream_len:
+                break
     nw_obj = cls(_ea_list)
 
-    _MOD_LOGGER.debug("Attempted to unpack EA from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack EA from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
     return nw_obj
 
 def _len_ea(self):
     '''Return the number of entries in the attribute list'''
-    return len(self._attr_list)
+    return len(self._ea_list)
 
 def _iter_ea(self):
-    return iter(self._attr_list)
+    return iter(self._ea_list)
 
 def _gitem_ea(self, index):
-    return _getitem(self._attr_list, index)
+    return _getitem(self._ea_list, index)
 
 _docstring_ea = '''Represents the content of a EA attribute.
 
@@ -1859,31 +2349,31 @@ def _from_binary_secd_header(cls, binary_stream):
         Reference to the DACL - 4 (offset relative to the header)
         Reference to the SACL - 4 (offset relative to the header)
     '''
-    nw_obj = cls(cls._REPR.unpack(binary_stream))
+    nw_obj = cls(*cls._REPR_UNPACK_FROM(binary_stream))
     nw_obj.control_flags = SecurityDescriptorFlags(nw_obj.control_flags)
 
-    _MOD_LOGGER.debug("Attempted to unpack Security Descriptor Header from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack Security Descriptor Header from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[:cls._REPR_SIZE]), nw_obj)
 
     return nw_obj
 
 def _len_secd_header(self):
     '''Returns the logical size of the file'''
-    return SecurityDescriptorHeader._REPR.size
+    return SecurityDescriptorHeader._REPR_SIZE
 
 _docstring_secd_header = '''Represents the header of the SECURITY_DESCRIPTOR attribute.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Revision number
-    content[1] (:obj:`SecurityDescriptorFlags`): Control flags
-    content[2] (int): Offset to the owner SID
-    content[3] (int): Offset to the group SID
-    content[4] (int): Offset to the DACL
-    content[5] (int): Offset to the SACL
+    revision_number (int): Revision number
+    control_flags (:obj:`SecurityDescriptorFlags`): Control flags
+    owner_sid_offset (int): Offset to the owner SID
+    group_sid_offset (int): Offset to the group SID
+    dacl_offset (int): Offset to the DACL
+    sacl_offset (int): Offset to the SACL
 
 Attributes:
     revision_number (int): Revision number
@@ -1906,22 +2396,26 @@ SecurityDescriptorHeader = _create_attrcontent_class("SecurityDescriptorHeader",
 
 #------------------------------------------------------------------------------
 
-def _from_binary_ace_header(cls, binary_stream):
-    """See base class."""
+def _from_binary_ace_header(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the header starts in ``binary_stream``.
+    """
     ''' ACE Type - 1
         ACE Control flags - 1
         Size - 2 (includes header size)
     '''
-    type, control_flags, size = cls._REPR.unpack(binary_stream)
-    nw_obj = cls((ACEType(type), ACEControlFlags(control_flags), size))
+    type, control_flags, size = cls._REPR_UNPACK_FROM(binary_stream, offset)
+    nw_obj = cls(_ACE_TYPE_CACHE[type], _ACE_CONTROL_FLAGS_CACHE[control_flags], size)
 
-    _MOD_LOGGER.debug("Attempted to unpack ACE Header from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack ACE Header from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[offset:offset+cls._REPR_SIZE]), nw_obj)
 
     return nw_obj
 
 def _len_ace_header(self):
     '''Returns the logical size of the file'''
-    return ACEHeader._REPR.size
+    return ACEHeader._REPR_SIZE
 
 _docstring_ace_header = '''Represents header of an ACE object.
 
@@ -1929,14 +2423,13 @@ As part of the an ACL, all ACE (Access Control Entry) have a header that
 is represented by this class.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`ACEType`): Type of ACE entry
-    content[1] (:obj:`ACEControlFlags`): ACE control flags
-    content[2] (int): size of the ACE entry, including the header
+    type (:obj:`ACEType`): Type of ACE entry
+    control_flags (:obj:`ACEControlFlags`): ACE control flags
+    ace_size (int): size of the ACE entry, including the header
 
 Attributes:
     type (:obj:`ACEType`): Type of ACE entry
@@ -1955,34 +2448,41 @@ ACEHeader = _create_attrcontent_class("ACEHeader",
 
 #-------------------------------------------------------------------------------
 
-def _from_binary_sid(cls, binary_stream):
-    """See base class."""
+@_lru_cache(maxsize=32)
+def _sub_auth_struct(sub_auth_len):
+    '''Returns the struct that reads ``sub_auth_len`` SID sub authorities'''
+    return struct.Struct(f"<{sub_auth_len}I")
+
+def _from_binary_sid(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the SID starts in ``binary_stream``.
+    """
     ''' Revision number - 1
         Number of sub authorities - 1
         Authority - 6
         Array of 32 bits with sub authorities - 4 * number of sub authorities
     '''
-    rev_number, sub_auth_len, auth = cls._REPR.unpack(binary_stream[:cls._REPR.size])
+    rev_number, sub_auth_len, auth = cls._REPR_UNPACK_FROM(binary_stream, offset)
     if sub_auth_len:
-        sub_auth_repr = struct.Struct("<" + str(sub_auth_len) + "I")
-        sub_auth = sub_auth_repr.unpack(binary_stream[cls._REPR.size:cls._REPR.size + sub_auth_repr.size])
+        sub_auth = _sub_auth_struct(sub_auth_len).unpack_from(binary_stream, offset + cls._REPR_SIZE)
     else:
         sub_auth = ()
 
-    nw_obj = cls((rev_number, int.from_bytes(auth, byteorder="big"), sub_auth))
+    nw_obj = cls(rev_number, int.from_bytes(auth, byteorder="big"), sub_auth)
 
-    _MOD_LOGGER.debug("Attempted to unpack SID from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack SID from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[offset:offset+len(nw_obj)]), nw_obj)
 
     return nw_obj
 
 def _len_sid(self):
     '''Returns the size of the SID in bytes'''
-    return SID._REPR.size + (4 * sub_auth_len)
+    return SID._REPR_SIZE + (len(self.sub_authorities) << 2)
 
 def _str_sid(self):
     'Return a nicely formatted representation string'
-    sub_auths = "-".join([str(sub) for sub in self.sub_authorities])
-    return f'S-{self.revision_number}-{self.authority}-{sub_auths}'
+    return "S-%d-%d-%s" % (self.revision_number, self.authority, "-".join(map(str, self.sub_authorities)))
 
 _docstring_sid = '''Represents the content of a SID object to be used by the SECURITY_DESCRIPTOR
 attribute.
@@ -1992,20 +2492,18 @@ This represents a Microsoft SID, normally seen as::
     S-1-5-21-7623811015-3361044348-030300820-1013
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (int): Revision number
-    content[1] (int): Number of sub authorities
-    content[2] (int): Authority
-    sub_authorities (list(int)): List of sub authorities
+    revision_number (int): Revision number
+    authority (int): Authority
+    sub_authorities (tuple(int)): Sub authorities
 
 Attributes:
     revision_number (int): Revision number
     authority (int): Authority
-    sub_authorities (list(int)): List of sub authorities
+    sub_authorities (tuple(int)): Sub authorities
 '''
 
 _sid_namespace = {"__len__" : _len_sid,
@@ -2020,21 +2518,24 @@ SID = _create_attrcontent_class("SID",
 
 #-------------------------------------------------------------------------------
 
-def _from_binary_b_ace(cls, binary_stream):
-    """See base class."""
+def _from_binary_b_ace(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the ACE content starts in ``binary_stream``.
+    """
     ''' Access rights flags - 4
         SID - n
     '''
-    access_flags = cls._REPR.unpack(binary_stream[:cls._REPR.size])[0]
-    sid = SID.create_from_binary(binary_stream[cls._REPR.size:])
+    access_flags = cls._REPR_UNPACK_FROM(binary_stream, offset)[0]
+    sid = SID.create_from_binary(binary_stream, offset + cls._REPR_SIZE)
 
-    nw_obj = cls((ACEAccessFlags(access_flags), sid))
+    nw_obj = cls(_ACE_ACCESS_FLAGS_CACHE[access_flags], sid)
 
     return nw_obj
 
 def _len_b_ace(self):
     '''Returns the logical size of the file'''
-    return BasicACE._REPR.size
+    return BasicACE._REPR_SIZE
 
 _docstring_b_ace = '''Represents one the types of ACE entries. The Basic type.
 
@@ -2042,19 +2543,16 @@ The Basic ACE is a very simple entry that contains the access flags for a
 particular SID.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`ACEAccessFlags`): Access rights flags
-    content[1] (:obj:`SID`): SID
-
-    self.access_rights_flags, self.sid
+    access_rights_flags (:obj:`ACEAccessFlags`): Access rights flags
+    SID (:obj:`SID`): SID
 
 Attributes:
     access_rights_flags (:obj:`ACEAccessFlags`): Access rights flags
-    sid (:obj:`SID`): SID
+    SID (:obj:`SID`): SID
 '''
 
 _b_ace_namespace = {"__len__" : _len_b_ace,
@@ -2068,8 +2566,11 @@ BasicACE = _create_attrcontent_class("BasicACE",
 
 #-------------------------------------------------------------------------------
 
-def _from_binary_obj_ace(cls, binary_stream):
-    """See base class."""
+def _from_binary_obj_ace(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the ACE content starts in ``binary_stream``.
+    """
     ''' Access rights flags - 4
         Flags - 4
         Object type class identifier (GUID) - 16
@@ -2077,16 +2578,16 @@ def _from_binary_obj_ace(cls, binary_stream):
         SID - n
     '''
     #content = cls._REPR.unpack(binary_stream[:cls._REPR.size])
-    access_flags, flags, object_guid, inher_guid = cls._REPR.unpack(binary_stream[:cls._REPR.size])
-    sid = SID.create_from_binary(binary_stream[cls._REPR.size:])
+    access_flags, flags, object_guid, inher_guid = cls._REPR_UNPACK_FROM(binary_stream, offset)
+    sid = SID.create_from_binary(binary_stream, offset + cls._REPR_SIZE)
 
-    nw_obj = cls((ACEAccessFlags(access_flags),flags, UUID(bytes_le=object_guid), UUID(bytes_le=inher_guid), sid))
+    nw_obj = cls(_ACE_ACCESS_FLAGS_CACHE[access_flags], flags, UUID(bytes_le=object_guid), UUID(bytes_le=inher_guid), sid)
 
     return nw_obj
 
 def _len_obj_ace(self):
     '''Returns the logical size of the file'''
-    return ObjectACE._REPR.size + len(self.sid)
+    return ObjectACE._REPR_SIZE + len(self.sid)
 
 _docstring_obj_ace = '''Represents one the types of ACE entries. The Object type.
 
@@ -2095,16 +2596,15 @@ of undocumented flags, the object id and its inherited object id and the SID
 where it is applicable.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`ACEAccessFlags`): Access rights flags
-    content[1] (int): Flags
-    content[2] (:obj:`UUID`): Object type class identifier (GUID)
-    content[3] (:obj:`UUID`): Inherited object type class identifier (GUID)
-    content[4] (:obj:`SID`): SID
+    access_rights_flags (:obj:`ACEAccessFlags`): Access rights flags
+    flags (int): Flags
+    object_guid (:obj:`UUID`): Object type class identifier (GUID)
+    inherited_guid (:obj:`UUID`): Inherited object type class identifier (GUID)
+    sid (:obj:`SID`): SID
 
 Attributes:
     access_rights_flags (:obj:`ACEAccessFlags`): Access rights flags
@@ -2114,8 +2614,8 @@ Attributes:
     sid (:obj:`SID`): SID
 '''
 
-_obj_ace_namespace = {"__len__" : _len_b_ace,
-                    "create_from_binary" : classmethod(_from_binary_b_ace)
+_obj_ace_namespace = {"__len__" : _len_obj_ace,
+                    "create_from_binary" : classmethod(_from_binary_obj_ace)
                  }
 
 ObjectACE = _create_attrcontent_class("ObjectACE",
@@ -2131,21 +2631,27 @@ class CompoundACE():
 
 #-------------------------------------------------------------------------------
 
-def _from_binary_ace(cls, binary_stream):
-    nw_obj = cls()
-    header = ACEHeader.create_from_binary(binary_stream[:cls._HEADER_SIZE])
+def _from_binary_basic_ace_content(cls, header, binary_stream, offset):
+    return cls(header, BasicACE.create_from_binary(binary_stream, offset))
 
-    nw_obj.header = header
+def _from_binary_object_ace_content(cls, header, binary_stream, offset):
+    return cls(header, None, ObjectACE.create_from_binary(binary_stream, offset))
 
-    #TODO create a _dispatcher and replace this slow ass comparison
-    if "OBJECT" in header.type.name:
-        nw_obj.object_ace = ObjectACE.create_from_binary(binary_stream[cls._HEADER_SIZE:])
-    elif "COMPOUND" in header.type.name:
-        pass
-    else:
-        nw_obj.basic_ace = BasicACE.create_from_binary(binary_stream[cls._HEADER_SIZE:])
+def _from_binary_compound_ace_content(cls, header, binary_stream, offset):
+    return cls(header)
 
-    return nw_obj
+_ACE_DISPATCH = {ace_type : _from_binary_object_ace_content if "OBJECT" in ace_type.name
+                    else _from_binary_compound_ace_content
+                        for ace_type in ACEType
+                            if "OBJECT" in ace_type.name or "COMPOUND" in ace_type.name}
+'''dict(ACEType : function): Function that creates the ``ACE`` for the ACE types
+that don't have a basic content, any other type uses ``_from_binary_basic_ace_content``'''
+
+def _from_binary_ace(cls, binary_stream, offset=0):
+    header = ACEHeader.create_from_binary(binary_stream, offset)
+
+    return _ACE_DISPATCH.get(header.type, _from_binary_basic_ace_content)(cls,
+                header, binary_stream, offset + cls._HEADER_SIZE)
 
 def _len_ace(self):
     '''Returns the logical size of the file'''
@@ -2160,14 +2666,13 @@ Important:
     The class should never have both basic ace and object ace attributes.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`ACEHeader`): Created timestamp
-    content[1] (:obj:`BasicACE`): Changed timestamp
-    content[2] (:obj:`ObjectACE`): MFT change timestamp
+    header (:obj:`ACEHeader`): Created timestamp
+    basic_ace (:obj:`BasicACE`): Changed timestamp
+    object_ace (:obj:`ObjectACE`): MFT change timestamp
 
 Attributes:
     header (:obj:`ACEHeader`): Created timestamp
@@ -2187,27 +2692,31 @@ ACE = _create_attrcontent_class("ACE",
 
 #-------------------------------------------------------------------------------
 
-def _from_binary_acl(cls, binary_stream):
-    """See base class."""
+def _from_binary_acl(cls, binary_stream, offset=0):
+    """See base class.
+
+    The ``offset`` is where the ACL starts in ``binary_stream``.
+    """
     ''' Revision number - 1
         Padding - 1
         Size - 2
         ACE Count - 2
         Padding - 2
     '''
-    rev_number, size, ace_len = cls._REPR.unpack(binary_stream[:cls._REPR.size])
+    rev_number, size, ace_len = cls._REPR_UNPACK_FROM(binary_stream, offset)
     #content = cls._REPR.unpack(binary_stream[:cls._REPR.size])
-    aces = []
+    create_ace = ACE.create_from_binary
+    aces = [None] * ace_len
 
-    offset = cls._REPR.size
+    ace_offset = offset + cls._REPR_SIZE
     for i in range(ace_len):
-        ace = ACE.create_from_binary(binary_stream[offset:])
-        offset += len(ace)
-        aces.append(ace)
-        _MOD_LOGGER.debug("Next ACE offset = %d", offset)
-    nw_obj = cls((rev_number, size, aces))
+        ace = create_ace(binary_stream, ace_offset)
+        ace_offset += ace.header.ace_size
+        aces[i] = ace
+    nw_obj = cls(rev_number, size, aces)
 
-    _MOD_LOGGER.debug("Attempted to unpack SID from \"%s\"\nResult: %s", binary_stream.tobytes(), nw_obj)
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack ACL from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream[offset:offset+size]), nw_obj)
 
     return nw_obj
 
@@ -2220,20 +2729,18 @@ _docstring_acl = '''Represents an ACL for the SECURITY_DESCRIPTOR.
 Represents a Access Control List (ACL), which contains multiple ACE entries.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`datetime`): Revision number
-    content[1] (int): Size
-    content[2] (int): Number of ACE entries
-    aces (list(:obj:`ACE`)): MFT change timestamp
+    revision_number (int): Revision number
+    size (int): Size
+    aces (list(:obj:`ACE`)): ACE entries
 
 Attributes:
-    revision_number[0] (:obj:`datetime`): Revision number
+    revision_number (int): Revision number
     size (int): Size
-    aces (list(:obj:`ACE`)): MFT change timestamp
+    aces (list(:obj:`ACE`)): ACE entries
 '''
 
 _acl_namespace = {"__len__" : _len_acl,
@@ -2249,20 +2756,23 @@ ACL = _create_attrcontent_class("ACL",
 
 def _from_binary_sec_desc(cls, binary_stream):
     """See base class."""
-    header = SecurityDescriptorHeader.create_from_binary(binary_stream[:SecurityDescriptorHeader.get_representation_size()])
+    header = SecurityDescriptorHeader.create_from_binary(binary_stream)
 
-    owner_sid = SID.create_from_binary(binary_stream[header.owner_sid_offset:])
-    group_sid = SID.create_from_binary(binary_stream[header.group_sid_offset:])
+    owner_sid = SID.create_from_binary(binary_stream, header.owner_sid_offset)
+    group_sid = SID.create_from_binary(binary_stream, header.group_sid_offset)
     dacl = None
     sacl = None
 
     if header.sacl_offset:
-        sacl = ACL.create_from_binary(binary_stream[header.sacl_offset:])
+        sacl = ACL.create_from_binary(binary_stream, header.sacl_offset)
     if header.dacl_offset:
-        dacl = ACL.create_from_binary(binary_stream[header.dacl_offset:])
+        dacl = ACL.create_from_binary(binary_stream, header.dacl_offset)
+
+    nw_obj = cls(header, owner_sid, group_sid, sacl, dacl)
+
+    if _MOD_LOGGER.isEnabledFor(logging.DEBUG):
+        _MOD_LOGGER.debug("Attempted to unpack SECURITY_DESCRIPTOR from \"%s\"\nResult: %s", _Lazy(bytes, binary_stream), nw_obj)
 
-    nw_obj = cls((header, owner_sid, group_sid, sacl, dacl))
-    
     return nw_obj
 
 
@@ -2278,16 +2788,15 @@ discretionary access control list (DACL) and a system access control list (SACL)
 Both DACL and SACL are ACLs with the same format.
 
 Note:
-    This class receives an Iterable as argument, the "Parameters/Args" section
-    represents what must be inside the Iterable. The Iterable MUST preserve
-    order or things might go boom.
+    This class receives the content as positional arguments, the
+    "Parameters/Args" section lists them in order.
 
 Args:
-    content[0] (:obj:`SecurityDescriptorHeader`): Created timestamp
-    content[1] (:obj:`SID`): Changed timestamp
-    content[2] (:obj:`SID`): MFT change timestamp
-    content[3] (:obj:`ACL`): Accessed timestamp
-    content[4] (:obj:`ACL`): Accessed timestamp
+    header (:obj:`SecurityDescriptorHeader`): Created timestamp
+    owner_sid (:obj:`SID`): Changed timestamp
+    group_sid (:obj:`SID`): MFT change timestamp
+    sacl (:obj:`ACL`): Accessed timestamp
+    dacl (:obj:`ACL`): Accessed timestamp
 
 Attributes:
     header (:obj:`SecurityDescriptorHeader`): Created timestamp